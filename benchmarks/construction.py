@@ -0,0 +1,48 @@
+"""Measure the time needed to construct element trees.
+
+Run from the repository root:
+
+    python benchmarks/construction.py
+
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from htmlgen import TableRow, UnorderedList  # noqa: E402
+
+ROWS = 1000
+COLUMNS = 100
+ITEMS = 100000
+
+CELL_CONTENT = ["x"] * COLUMNS
+ITEM_CONTENT = ["x"] * ITEMS
+
+
+def create_cells():
+    for _ in range(ROWS):
+        TableRow().create_cells(*CELL_CONTENT)
+
+
+def create_items():
+    UnorderedList().create_items(*ITEM_CONTENT)
+
+
+def main():
+    for name, function, count in [
+        ("TableRow.create_cells", create_cells, ROWS * COLUMNS),
+        ("UnorderedList.create_items", create_items, ITEMS),
+    ]:
+        duration = min(timeit.repeat(function, number=1, repeat=5))
+        print(
+            "{:<28} {:>6.0f} ms ({:.2f} µs per element)".format(
+                name, duration * 1000, duration / count * 1000000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
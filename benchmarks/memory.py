@@ -0,0 +1,65 @@
+"""Measure the memory used by element trees.
+
+Run from the repository root:
+
+    python benchmarks/memory.py
+
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from htmlgen import Division, Table, TableCell  # noqa: E402
+
+ROWS = 1000
+COLUMNS = 100
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def build_cells():
+    return [TableCell() for _ in range(ROWS * COLUMNS)]
+
+
+def build_divisions():
+    return [Division() for _ in range(ROWS * COLUMNS)]
+
+
+def build_table():
+    table = Table()
+    for _ in range(ROWS):
+        table.create_row().create_cells(*["x"] * COLUMNS)
+    return table
+
+
+def main():
+    count = ROWS * COLUMNS
+    for name, build in [
+        ("empty TableCell", build_cells),
+        ("empty Division", build_divisions),
+        ("Table, per cell", build_table),
+    ]:
+        size = measure(build)
+        print(
+            "{:<20} {:>8.0f} bytes ({:.1f} MiB total)".format(
+                name, size / count, size / 1024 / 1024
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
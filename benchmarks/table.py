@@ -0,0 +1,199 @@
+"""Compare ways to build and render large tables.
+
+Run from the repository root:
+
+    python benchmarks/table.py
+
+"""
+
+import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from htmlgen import (  # noqa: E402
+    Link,
+    RowTemplate,
+    Slot,
+    Table,
+    TableRow,
+)
+from htmlgen.escaping import escape_text  # noqa: E402
+from htmlgen.formatting import (  # noqa: E402
+    format_dates,
+    format_decimals,
+    format_strings,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROWS = 50000
+COLUMNS = 10
+
+NAMES = ["Column {}".format(i) for i in range(COLUMNS)]
+DATA = [["{}-{}".format(i, j) for i in range(ROWS)] for j in range(COLUMNS)]
+
+
+START_DATE = datetime.date(2000, 1, 1)
+REPORT = {
+    "Name": ["Account {}".format(i) for i in range(ROWS)],
+    "Date": [START_DATE + datetime.timedelta(days=i) for i in range(ROWS)],
+}
+for i in range(COLUMNS - 2):
+    REPORT["Amount {}".format(i)] = [
+        (i * 7919 + j * 104729) % 10000000 / 100 for j in range(ROWS)
+    ]
+FORMAT_AMOUNT = partial(format_decimals, thousands_separator=",")
+FORMATTERS = {"Name": format_strings, "Date": format_dates}
+for name in REPORT:
+    if name.startswith("Amount"):
+        FORMATTERS[name] = FORMAT_AMOUNT
+
+NUMPY_REPORT = {}
+if numpy is not None:
+    for name, values in REPORT.items():
+        if name == "Date":
+            NUMPY_REPORT[name] = numpy.array(values, dtype="datetime64[D]")
+        else:
+            NUMPY_REPORT[name] = numpy.array(values)
+
+
+ACCOUNT_ROWS = [
+    ("Account {}".format(i), "{:.2f}".format(i / 7), "open")
+    for i in range(ROWS)
+]
+
+
+def build_account_row(name, amount, status):
+    row = TableRow()
+    row.create_cell(name).add_css_classes("name")
+    amount_cell = row.create_cell(amount)
+    amount_cell.add_css_classes("amount", "numeric")
+    amount_cell.columns = 2
+    row.create_cell(status).add_css_classes("status")
+    row.create_cell(Link("/help/accounts", "Help"))
+    return row
+
+
+def render_row_elements():
+    table = Table()
+    for row in ACCOUNT_ROWS:
+        table.append_row(build_account_row(*row))
+    return table.render()
+
+
+def render_row_template():
+    prototype = build_account_row(Slot("name"), Slot("amount"), Slot("status"))
+    template = RowTemplate(prototype)
+    table = Table()
+    table.create_body().append(template.fill_rows(ACCOUNT_ROWS))
+    return table.render()
+
+
+def measure_row_templates():
+    results = []
+    for name, function in [
+        ("TableRow per row", render_row_elements),
+        ("RowTemplate", render_row_template),
+    ]:
+        gc.collect()
+        start = time.perf_counter()
+        results.append(function())
+        duration = time.perf_counter() - start
+        print("{:<18} {:>6.0f} ms".format(name, duration * 1000))
+    assert results[0] == results[1]
+
+
+def build_rows():
+    table = Table()
+    table.create_simple_header_row(*NAMES)
+    for row in zip(*DATA):
+        table.create_simple_row(*row)
+    return table
+
+
+def build_columns():
+    return Table.from_columns(dict(zip(NAMES, DATA)))
+
+
+def measure(name, build):
+    gc.collect()
+    start = time.perf_counter()
+    table = build()
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    html = table.render()
+    render_time = time.perf_counter() - start
+    del table
+    gc.collect()
+    tracemalloc.start()
+    table = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        "{:<18} build {:>6.0f} ms  render {:>6.0f} ms  {:>6.1f} MiB".format(
+            name, build_time * 1000, render_time * 1000, size / 1024 / 1024
+        )
+    )
+    return html
+
+
+def format_per_cell():
+    columns = {}
+    for name, values in REPORT.items():
+        if name == "Name":
+            columns[name] = [escape_text(value) for value in values]
+        elif name == "Date":
+            columns[name] = [value.isoformat() for value in values]
+        else:
+            columns[name] = ["{:,.2f}".format(value) for value in values]
+    return Table.from_columns(columns).render()
+
+
+def format_columns():
+    return Table.from_columns(REPORT, FORMATTERS).render()
+
+
+def format_numpy_columns():
+    return Table.from_columns(NUMPY_REPORT, FORMATTERS).render()
+
+
+def measure_formatting():
+    functions = [
+        ("per cell", format_per_cell),
+        ("formatters", format_columns),
+    ]
+    if numpy is not None:
+        functions.append(("formatters, NumPy", format_numpy_columns))
+    results = []
+    for name, function in functions:
+        start = time.perf_counter()
+        results.append(function())
+        duration = time.perf_counter() - start
+        print("{:<18} {:>6.0f} ms".format(name, duration * 1000))
+    assert all(html == results[0] for html in results)
+
+
+def main():
+    print("Building and rendering:")
+    rows_html = measure("create_simple_row", build_rows)
+    columns_html = measure("from_columns", build_columns)
+    assert rows_html == columns_html
+    print()
+    print("Formatting and rendering a report:")
+    measure_formatting()
+    print()
+    print("Building and rendering rows with the same structure:")
+    measure_row_templates()
+
+
+if __name__ == "__main__":
+    main()
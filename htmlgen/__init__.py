@@ -11,6 +11,7 @@ from .attribute import (
     css_class_attribute,
 )
 from .block import Division, Paragraph, Preformatted
+from .cache import FragmentCache, CachedFragment, fragment_cache
 from .document import (
     Document,
     HTMLRoot,
@@ -24,6 +25,13 @@ from .document import (
     json_script,
 )
 from .element import ElementBase, Element, VoidElement, is_element
+from .escaping import (
+    escape_html,
+    escape_text,
+    escape_text_list,
+    escape_attribute,
+    set_conservative_escaping,
+)
 from .form import (
     Form,
     Input,
@@ -45,9 +53,12 @@ from .form import (
     RadioButton,
     Label,
 )
+from .formatting import format_strings, format_decimals, format_dates
 from .generator import (
     Generator,
     NullGenerator,
+    FlushGenerator,
+    FrozenGenerator,
     IteratorGenerator,
     ChildGenerator,
     HTMLChildGenerator,
@@ -76,6 +87,7 @@ from .list import (
     DescriptionDefinition,
     DescriptionTerm,
 )
+from .parallel import ParallelGenerator, render_parallel, iter_parallel
 from .structure import (
     Section,
     Article,
@@ -89,10 +101,16 @@ from .table import (
     Table,
     TableHead,
     TableBody,
+    ColumnarTableBody,
+    TableWindow,
+    TablePager,
+    AsyncTableBody,
     TableRow,
+    RowTemplate,
     TableHeaderCell,
     TableCell,
     ColumnGroup,
     Column,
 )
+from .template import Slot, Template, split_at_slots
 from .time import Time
@@ -1,13 +1,18 @@
 from .attribute import *
 from .block import *
+from .cache import *
 from .document import *
 from .element import *
+from .escaping import *
 from .form import *
+from .formatting import *
 from .generator import *
 from .image import *
 from .inline import *
 from .link import *
 from .list import *
+from .parallel import *
 from .structure import *
 from .table import *
+from .template import *
 from .time import *
@@ -0,0 +1,383 @@
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import Awaitable
+from types import GeneratorType
+
+# Number of strings generated between giving control back to the event loop.
+# Synchronous parts of a tree are joined into batches of at most this many
+# strings.
+FRAGMENTS_PER_YIELD = 500
+
+# Default number of asynchronous children rendered concurrently.
+MAX_CONCURRENCY = 10
+
+# inspect.isasyncgenfunction() is not available in Python 3.5.
+_isasyncgenfunction = getattr(inspect, "isasyncgenfunction", lambda f: False)
+
+
+class ConcurrentChildren(object):
+
+    """Children of a generator that can be rendered concurrently.
+
+    agenerate() methods can return a ConcurrentChildren object instead of
+    an iterator. During asynchronous rendering, asynchronous children are
+    then started in the background, also if they are children of other
+    ConcurrentChildren objects further down the tree. Their output is
+    still generated in order.
+
+    """
+
+    def __init__(self, children):
+        self.children = children
+
+
+class AsyncFlattener(object):
+
+    """An asynchronous iterator over the strings generated by a generator.
+
+    AsyncFlattener works like Generator.__iter__(), but generate() methods
+    may also return asynchronous iterators, for example by using
+    "async def generate()". Any awaitable returned from generate() is
+    awaited, and its result is treated like any other generated value.
+
+    If text is True, AsyncFlattener returns str objects, otherwise UTF-8
+    encoded byte strings. Strings generated by synchronous iterators are
+    joined into batches of up to FRAGMENTS_PER_YIELD strings. A batch ends
+    before anything is awaited, so that streamed output is not delayed.
+
+    Generators can override agenerate() to provide a different iterator for
+    asynchronous rendering. If available, agenerate() is used instead of
+    generate().
+
+    If agenerate() returns a ConcurrentChildren object, children that are
+    awaitables or whose generate() or agenerate() methods are asynchronous
+    are started in the background as soon as they are reached. While
+    waiting for such a child, AsyncFlattener renders up to
+    FRAGMENTS_PER_YIELD strings ahead, so that asynchronous children of
+    following elements are started as well. The output is still generated
+    in order.
+
+    At most max_concurrency children are rendered in the background at any
+    time, across the whole tree. A child that is reached while no slot is
+    free waits for one. If no slot became free by the time all output
+    before the child was generated, it is rendered in place.
+
+    Every FRAGMENTS_PER_YIELD strings, control is given back to the event
+    loop, so that rendering large, synchronous trees does not block it.
+
+    If iteration is stopped early, for example because the client
+    disconnected, aclose() must be awaited to cancel the children that
+    are rendered in the background. This happens automatically if
+    rendering fails.
+
+    """
+
+    def __init__(
+        self, generator, text=False, max_concurrency=None, _limit=None
+    ):
+        if _limit is None:
+            if max_concurrency is None:
+                max_concurrency = MAX_CONCURRENCY
+            _limit = _ConcurrencyLimit(max_concurrency)
+        self._stack = []
+        self._text = text
+        self._limit = _limit
+        # Background tasks, each with the fragments generated before it.
+        self._tasks = deque()
+        # Fragments generated after the last background task.
+        self._fragments = []
+        # A child that could not be started, because no slot was free.
+        self._waiting = None
+        self._fragment_count = 0
+        self._push(generator)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._next()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self):
+        """Stop rendering and clean up.
+
+        Children rendered in the background are cancelled, and the
+        aclose() methods of all iterators that are currently being
+        rendered - for example asynchronous generators - are awaited.
+        Afterwards, the iterator is exhausted.
+
+        """
+        tasks = self._tasks
+        self._tasks = deque()
+        self._fragments = []
+        self._waiting = None
+        for _, task in tasks:
+            if task.done():
+                # Retrieve the exception, so that it is not logged.
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+        stack = self._stack
+        self._stack = []
+        while stack:
+            iterator, _ = stack.pop()
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def _next(self):
+        stack = self._stack
+        while True:
+            self._walk()
+            tasks = self._tasks
+            if tasks:
+                fragments, task = tasks[0]
+                if fragments:
+                    tasks[0] = ([], task)
+                    return await self._join(fragments)
+                tasks.popleft()
+                return await task
+            fragments = self._fragments
+            if fragments:
+                self._fragments = []
+                return await self._join(fragments)
+            if self._waiting is not None:
+                # All output before the child was generated, but no slot
+                # became free.
+                stack.append((iter([self._waiting]), _MODE_SYNC))
+                self._waiting = None
+                continue
+            if not stack:
+                raise StopAsyncIteration()
+            # The top of the stack must be awaited. This is only done
+            # after the previous batch was returned.
+            iterator, mode = stack[-1]
+            if mode is _MODE_AWAIT:
+                stack.pop()
+                item = await iterator
+            else:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    stack.pop()
+                    continue
+            stack.append((iter([item]), _MODE_SYNC))
+
+    def _walk(self):
+        # Render the synchronous iterators at the top of the stack into
+        # fragments, until the batch is full or something must be awaited.
+        # Asynchronous children of concurrent iterators are started in the
+        # background.
+        #
+        # Like Generator._flatten(), items are dispatched on their exact
+        # type, and the kinds of other types are cached per class.
+        if self._waiting is not None:
+            if not self._start(self._waiting):
+                return
+            self._waiting = None
+        stack = self._stack
+        kinds = _async_kinds
+        text = self._text
+        fragments = self._fragments
+        append = fragments.append
+        while stack:
+            iterator, mode = stack[-1]
+            if mode is _MODE_ASYNC or mode is _MODE_AWAIT:
+                return
+            for item in iterator:
+                item_type = type(item)
+                if item_type is str:
+                    append(item if text else item.encode("utf-8"))
+                elif item_type is bytes:
+                    append(item.decode("utf-8") if text else item)
+                else:
+                    kind = kinds.get(item_type)
+                    if kind is None:
+                        kind = _async_kind(item_type)
+                    if kind is _KIND_OTHER:
+                        kind = _instance_kind(item)
+                    if kind is _KIND_GENERATOR:
+                        self._push(item)
+                        break
+                    elif kind is _KIND_STR:
+                        item = str(item)
+                        append(item if text else item.encode("utf-8"))
+                    elif kind is _KIND_BYTES:
+                        item = bytes(item)
+                        append(item.decode("utf-8") if text else item)
+                    elif mode is _MODE_CONCURRENT:
+                        if not self._start(item):
+                            self._waiting = item
+                            return
+                        fragments = self._fragments
+                        append = fragments.append
+                    elif kind is _KIND_AWAITABLE:
+                        stack.append((item, _MODE_AWAIT))
+                        break
+                    else:
+                        self._push(item)
+                        break
+                if len(fragments) >= FRAGMENTS_PER_YIELD:
+                    return
+            else:
+                stack.pop()
+
+    async def _join(self, fragments):
+        self._fragment_count += len(fragments)
+        if self._fragment_count >= FRAGMENTS_PER_YIELD:
+            self._fragment_count = 0
+            await asyncio.sleep(0)
+        if len(fragments) == 1:
+            return fragments[0]
+        return ("" if self._text else b"").join(fragments)
+
+    def _push(self, generator):
+        agenerate = getattr(generator, "agenerate", None)
+        if agenerate is not None:
+            iterator = agenerate()
+        else:
+            iterator = generator.generate()
+        mode = _iterator_mode(iterator)
+        if mode is _MODE_SYNC:
+            self._stack.append((iter(iterator), _MODE_SYNC))
+        elif mode is _MODE_CONCURRENT:
+            self._stack.append((iter(iterator.children), _MODE_CONCURRENT))
+        else:
+            self._stack.append((iterator, mode))
+
+    def _start(self, child):
+        limit = self._limit
+        if limit.available <= 0:
+            return False
+        limit.available -= 1
+        task = asyncio.ensure_future(self._render_child(child))
+        task.add_done_callback(limit.release)
+        self._tasks.append((self._fragments, task))
+        self._fragments = []
+        return True
+
+    async def _render_child(self, child):
+        flattener = AsyncFlattener(
+            _ItemGenerator(child), text=self._text, _limit=self._limit
+        )
+        fragments = []
+        async for fragment in flattener:
+            fragments.append(fragment)
+        return ("" if self._text else b"").join(fragments)
+
+
+class _ItemGenerator(object):
+    def __init__(self, item):
+        self._item = item
+
+    def generate(self):
+        return iter([self._item])
+
+
+class _ConcurrencyLimit(object):
+    def __init__(self, max_concurrency):
+        self.available = max_concurrency
+
+    def release(self, _task):
+        self.available += 1
+
+
+def concurrent_children(iterator):
+    """Wrap a synchronous iterator into a ConcurrentChildren object.
+
+    Asynchronous iterators and awaitables are returned unchanged.
+
+    """
+    if _iterator_mode(iterator) is _MODE_SYNC:
+        return ConcurrentChildren(iterator)
+    return iterator
+
+
+# How the stack of an AsyncFlattener iterates an iterator. Concurrent
+# iterators are synchronous iterators over children that can be started
+# in the background.
+_MODE_SYNC = "sync"
+_MODE_ASYNC = "async"
+_MODE_AWAIT = "await"
+_MODE_CONCURRENT = "concurrent"
+
+_KIND_GENERATOR = "generator"
+_KIND_ASYNC_GENERATOR = "async generator"
+_KIND_AWAITABLE = "awaitable"
+_KIND_STR = "str"
+_KIND_BYTES = "bytes"
+_KIND_OTHER = "other"
+
+# Caches of the kinds of item types and of the modes of iterator types,
+# like htmlgen.generator._item_kinds. The caches are cleared when they are
+# full, so that classes created at runtime are not kept alive forever.
+_async_kinds = {}
+_iterator_modes = {}
+_CACHE_SIZE = 1024
+
+
+def _async_kind(item_type):
+    if issubclass(item_type, Awaitable):
+        kind = _KIND_AWAITABLE
+    elif _has_async_method(item_type):
+        kind = _KIND_ASYNC_GENERATOR
+    elif hasattr(item_type, "generate"):
+        kind = _KIND_GENERATOR
+    elif issubclass(item_type, str):
+        kind = _KIND_STR
+    elif issubclass(item_type, bytes):
+        kind = _KIND_BYTES
+    else:
+        # Instances may still be awaitable or have a generate() method.
+        return _KIND_OTHER
+    if len(_async_kinds) >= _CACHE_SIZE:
+        _async_kinds.clear()
+    _async_kinds[item_type] = kind
+    return kind
+
+
+def _instance_kind(item):
+    if inspect.isawaitable(item):
+        return _KIND_AWAITABLE
+    elif hasattr(item, "generate"):
+        return _KIND_GENERATOR
+    raise TypeError("can not generate {}".format(repr(item)))
+
+
+def _has_async_method(item_type):
+    for name in ["agenerate", "generate"]:
+        method = getattr(item_type, name, None)
+        if method is not None and (
+            inspect.iscoroutinefunction(method) or _isasyncgenfunction(method)
+        ):
+            return True
+    return False
+
+
+def _iterator_mode(iterator):
+    iterator_type = type(iterator)
+    if iterator_type is GeneratorType:
+        # Generator-based coroutines are awaitable generators.
+        if iterator.gi_code.co_flags & inspect.CO_ITERABLE_COROUTINE:
+            return _MODE_AWAIT
+        return _MODE_SYNC
+    mode = _iterator_modes.get(iterator_type)
+    if mode is not None:
+        return mode
+    if issubclass(iterator_type, ConcurrentChildren):
+        mode = _MODE_CONCURRENT
+    elif hasattr(iterator_type, "__anext__"):
+        mode = _MODE_ASYNC
+    elif issubclass(iterator_type, Awaitable):
+        mode = _MODE_AWAIT
+    else:
+        mode = _MODE_SYNC
+    if len(_iterator_modes) >= _CACHE_SIZE:
+        _iterator_modes.clear()
+    _iterator_modes[iterator_type] = mode
+    return mode
@@ -0,0 +1,23 @@
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Union
+
+FRAGMENTS_PER_YIELD: int
+MAX_CONCURRENCY: int
+_CACHE_SIZE: int
+_async_kinds: Dict[type, str]
+
+class ConcurrentChildren(object):
+    children: Iterable[Any]
+    def __init__(self, children: Iterable[Any]) -> None: ...
+
+class AsyncFlattener(AsyncIterator[Union[str, bytes]]):
+    def __init__(
+        self,
+        generator: Any,
+        text: bool = ...,
+        max_concurrency: Optional[int] = ...,
+    ) -> None: ...
+    def __aiter__(self) -> AsyncFlattener: ...
+    async def __anext__(self) -> Union[str, bytes]: ...
+    async def aclose(self) -> None: ...
+
+def concurrent_children(iterator: Any) -> Any: ...
@@ -15,6 +15,8 @@ class Division(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Division, self).__init__("div")
         self.extend(content)
@@ -32,6 +34,8 @@ class Paragraph(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Paragraph, self).__init__("p")
         self.extend(content)
@@ -50,5 +54,7 @@ class Preformatted(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Preformatted, self).__init__("pre")
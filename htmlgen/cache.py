@@ -0,0 +1,154 @@
+import threading
+from collections import OrderedDict
+
+from htmlgen.generator import Generator
+
+
+class FragmentCache(object):
+
+    """A thread-safe cache for rendered HTML fragments.
+
+    Fragments are UTF-8 encoded byte strings, stored under a hashable key.
+    When the total size of all fragments exceeds max_size bytes, the
+    least recently used fragments are evicted:
+
+        >>> cache = FragmentCache(max_size=6)
+        >>> cache.set("a", b"Foo")
+        >>> cache.set("b", b"Bar")
+        >>> cache.get("a")
+        b'Foo'
+        >>> cache.set("c", b"Baz")
+        >>> cache.get("b") is None
+        True
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    Fragments larger than max_size are not cached at all.
+
+    """
+
+    def __init__(self, max_size=16 * 1024 * 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of cached fragments."""
+        return len(self._fragments)
+
+    def __contains__(self, key):
+        return key in self._fragments
+
+    @property
+    def size(self):
+        """Return the total size of all cached fragments in bytes."""
+        return self._size
+
+    def get(self, key):
+        """Return the fragment cached under key, or None.
+
+        Calls to get() are counted as hits or misses.
+
+        """
+        with self._lock:
+            try:
+                fragment = self._fragments[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+    def set(self, key, fragment):
+        """Cache a fragment under key, evicting old fragments if needed."""
+        if not isinstance(fragment, bytes):
+            raise TypeError("fragment must be bytes")
+        with self._lock:
+            self._remove(key)
+            if len(fragment) > self.max_size:
+                return
+            self._fragments[key] = fragment
+            self._size += len(fragment)
+            while self._size > self.max_size:
+                _, evicted = self._fragments.popitem(last=False)
+                self._size -= len(evicted)
+
+    def render(self, key, builder):
+        """Return the fragment cached under key.
+
+        If no fragment is cached under key, builder is called without
+        arguments. It must return a generator, which is rendered and
+        cached.
+
+        The cache is not locked while the generator is built and
+        rendered, so several threads may build the same fragment at once.
+
+        """
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = b"".join(builder())
+            self.set(key, fragment)
+        return fragment
+
+    def invalidate(self, key):
+        """Remove the fragment cached under key, if any."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        """Remove all fragments and reset the hit and miss counts."""
+        with self._lock:
+            self._fragments.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key):
+        fragment = self._fragments.pop(key, None)
+        if fragment is not None:
+            self._size -= len(fragment)
+
+
+# The process-wide default cache, used by CachedFragment.
+fragment_cache = FragmentCache()
+
+
+class CachedFragment(Generator):
+
+    """A generator that renders a sub-tree once and caches the result.
+
+    The sub-tree is built by calling builder without arguments. It is only
+    built and rendered when no fragment is cached under key, yet:
+
+        >>> from htmlgen import UnorderedList
+        >>> def build_menu():
+        ...     menu = UnorderedList()
+        ...     items = menu.create_items("Home", "Products")
+        ...     return menu
+        >>> cache = FragmentCache()
+        >>> str(CachedFragment("menu", build_menu, cache=cache))
+        '<ul><li>Home</li><li>Products</li></ul>'
+        >>> str(CachedFragment("menu", build_menu, cache=cache))
+        '<ul><li>Home</li><li>Products</li></ul>'
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    By default, the process-wide fragment_cache is used. Keys must be unique
+    per cache, and must include everything the fragment depends on.
+
+    """
+
+    __slots__ = ("key", "_builder", "_cache")
+
+    def __init__(self, key, builder, cache=None):
+        super(CachedFragment, self).__init__()
+        self.key = key
+        self._builder = builder
+        self._cache = cache if cache is not None else fragment_cache
+
+    def generate(self):
+        yield self._cache.render(self.key, self._builder)
@@ -0,0 +1,31 @@
+from typing import Callable, Hashable, Optional
+
+from htmlgen.generator import Generator
+
+class FragmentCache(object):
+    max_size: int
+    hits: int
+    misses: int
+    def __init__(self, max_size: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+    @property
+    def size(self) -> int: ...
+    def get(self, key: Hashable) -> Optional[bytes]: ...
+    def set(self, key: Hashable, fragment: bytes) -> None: ...
+    def render(
+        self, key: Hashable, builder: Callable[[], Generator]
+    ) -> bytes: ...
+    def invalidate(self, key: Hashable) -> None: ...
+    def clear(self) -> None: ...
+
+fragment_cache: FragmentCache
+
+class CachedFragment(Generator):
+    key: Hashable
+    def __init__(
+        self,
+        key: Hashable,
+        builder: Callable[[], Generator],
+        cache: Optional[FragmentCache] = ...,
+    ) -> None: ...
@@ -37,6 +37,8 @@ class Document(Generator):
 
     """
 
+    __slots__ = ("root",)
+
     def __init__(self, title=None, language="en"):
         super(Document, self).__init__()
         self.root = HTMLRoot(title=title, language=language)
@@ -88,6 +90,8 @@ class HTMLRoot(NonVoidElement):
 
     """
 
+    __slots__ = ("head", "body")
+
     def __init__(self, title="", language="en"):
         super(HTMLRoot, self).__init__("html")
         self.head = Head(title=title)
@@ -119,6 +123,8 @@ class Head(Element):
 
     """
 
+    __slots__ = ("_title",)
+
     def __init__(self, title=None):
         super(Head, self).__init__("head")
         self._title = Title(title)
@@ -154,6 +160,8 @@ class Body(Element):
 
     """HTML body (<body>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(Body, self).__init__("body")
 
@@ -162,6 +170,8 @@ class Title(NonVoidElement):
 
     """HTML page title (<title>) element."""
 
+    __slots__ = ("title",)
+
     def __init__(self, title=None):
         super(Title, self).__init__("title")
         self.title = title or ""
@@ -175,6 +185,8 @@ class Meta(VoidElement):
 
     """HTML meta information (<meta>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(Meta, self).__init__("meta")
 
@@ -213,6 +225,8 @@ class Script(NonVoidElement):
 
     """
 
+    __slots__ = ("script",)
+
     def __init__(self, url=None, script=None):
         assert url is None or script is None
         super(Script, self).__init__("script")
@@ -252,6 +266,8 @@ class HeadLink(VoidElement):
 
     """HTML meta data link (<link>) element."""
 
+    __slots__ = ()
+
     def __init__(self, relation, url):
         super(HeadLink, self).__init__("link")
         self.relation = relation
@@ -269,5 +285,7 @@ class Main(Element):
 
     """HTML main document content (<main>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(Main, self).__init__("main")
@@ -1,11 +1,9 @@
+import inspect
 import sys
+from bisect import bisect_left, insort
 
-from htmlgen.generator import Generator, HTMLChildGenerator
-
-if sys.version_info[0] < 3:
-    from cgi import escape
-else:
-    from html import escape
+from htmlgen.escaping import escape_attribute
+from htmlgen.generator import ChildGenerator, Generator, HTMLChildGenerator
 
 # TODO: Python 3: remove
 if sys.version_info[0] >= 3:
@@ -24,13 +22,28 @@ def is_element(o, element_name):
 
 
 class ElementBase(Generator):
+    __slots__ = (
+        "element_name",
+        "_attributes",
+        "_attribute_names",
+        "_css_classes",
+        "_styles",
+        "_attribute_string",
+    )
+
     def __init__(self, element_name):
         super(ElementBase, self).__init__()
         self.element_name = element_name
-        self._attributes = {}
-        self._css_classes = set()
-        self._styles = {}
-        self._data = _ElementDataProxy(self)
+        # Most elements never get attributes, CSS classes, or styles.
+        # Therefore, the containers are only allocated on first write.
+        self._attributes = None
+        self._attribute_names = None
+        self._css_classes = None
+        self._styles = None
+        # Cache of the rendered attributes, reset whenever attributes, CSS
+        # classes, or styles change. The element name is not part of the
+        # cache, so that it can be changed freely.
+        self._attribute_string = None
 
     def generate(self):
         raise NotImplementedError()
@@ -53,12 +66,15 @@ class ElementBase(Generator):
             '<div data-abc="xyz" data-foo="bar"></div>'
 
         """
-        return self._data
+        # The proxy is created on every access, instead of being stored
+        # on the element. Otherwise, every element would be part of a
+        # reference cycle and could only be freed by the garbage collector.
+        return _ElementDataProxy(self)
 
     @data.setter
     def data(self, data):
-        self._data.clear()
-        self._data = _ElementDataProxy.from_data(self, data)
+        self.data.clear()
+        _ElementDataProxy.from_data(self, data)
 
     def set_attribute(self, name, value):
         """Set an HTML attribute to a given string value.
@@ -75,7 +91,15 @@ class ElementBase(Generator):
         """
         if not isinstance(name, str_class) or not isinstance(value, str_class):
             raise TypeError("name and value must be strings")
-        self._attributes[name] = value
+        attributes = self._attributes
+        if attributes is None:
+            self._attributes = {name: value}
+            self._attribute_names = [name]
+        else:
+            if name not in attributes:
+                insort(self._attribute_names, name)
+            attributes[name] = value
+        self._attribute_string = None
 
     def get_attribute(self, name, default=None):
         """Return the value of an HTML attribute.
@@ -83,6 +107,8 @@ class ElementBase(Generator):
         If the attribute is not set, return the default value.
 
         """
+        if self._attributes is None:
+            return default
         return self._attributes.get(name, default)
 
     def remove_attribute(self, name):
@@ -91,14 +117,18 @@ class ElementBase(Generator):
         If the attribute is not set, do nothing.
 
         """
-        try:
-            del self._attributes[name]
-        except KeyError:
-            pass
+        if self._attributes is None or name not in self._attributes:
+            return
+        del self._attributes[name]
+        names = self._attribute_names
+        del names[bisect_left(names, name)]
+        self._attribute_string = None
 
     @property
     def attribute_names(self):
         """Return a set of all attribute names of this element."""
+        if self._attributes is None:
+            return set()
         return set(self._attributes.keys())
 
     def add_css_classes(self, *css_classes):
@@ -110,8 +140,16 @@ class ElementBase(Generator):
             '<div class="my-css"></div>'
 
         """
+        if not css_classes:
+            return
+        if self._css_classes is None:
+            self._css_classes = []
+        classes = self._css_classes
         for cls in css_classes:
-            self._css_classes.add(cls)
+            index = bisect_left(classes, cls)
+            if index == len(classes) or classes[index] != cls:
+                classes.insert(index, cls)
+        self._attribute_string = None
 
     def remove_css_classes(self, *css_classes):
         """Remove CSS classes from this element.
@@ -119,15 +157,22 @@ class ElementBase(Generator):
         Unknown classes are ignored.
 
         """
+        classes = self._css_classes
+        if classes is None:
+            return
         for cls in css_classes:
-            try:
-                self._css_classes.remove(cls)
-            except KeyError:
-                pass
+            index = bisect_left(classes, cls)
+            if index < len(classes) and classes[index] == cls:
+                del classes[index]
+                self._attribute_string = None
 
     def has_css_class(self, css_class):
         """Return whether this element has a CSS class."""
-        return css_class in self._css_classes
+        classes = self._css_classes
+        if classes is None:
+            return False
+        index = bisect_left(classes, css_class)
+        return index < len(classes) and classes[index] == css_class
 
     def set_style(self, name, value):
         """Set a CSS style on this element.
@@ -138,7 +183,10 @@ class ElementBase(Generator):
             '<div style="background-color: green"></div>'
 
         """
+        if self._styles is None:
+            self._styles = {}
         self._styles[name] = value
+        self._attribute_string = None
 
     @property
     def id(self):
@@ -154,23 +202,43 @@ class ElementBase(Generator):
             self.remove_attribute("id")
 
     def render_start_tag(self):
-        html = "<" + self.element_name
-        for attribute, value in sorted(self._attributes.items()):
-            html += self._get_attribute_string(attribute, value)
+        """Return the start tag of this element, without the closing ">".
+
+        The rendered attributes are cached until the attributes, CSS
+        classes, or styles of this element are changed.
+
+        """
+        attribute_string = self._attribute_string
+        if attribute_string is None:
+            attribute_string = self._render_attributes()
+            self._attribute_string = attribute_string
+        return "<" + self.element_name + attribute_string
+
+    def _render_attributes(self):
+        # Attribute names and CSS classes are kept sorted when they are
+        # added, so that the output is deterministic without sorting here.
+        parts = []
+        if self._attributes:
+            attributes = self._attributes
+            for attribute in self._attribute_names:
+                value = attributes[attribute]
+                parts.append(self._get_attribute_string(attribute, value))
         if self._css_classes:
-            html += self._get_attribute_string("class", self._class_value)
+            class_value = self._class_value
+            parts.append(self._get_attribute_string("class", class_value))
         if self._styles:
-            html += self._get_attribute_string("style", self._style_value)
-        return html
+            style_value = self._style_value
+            parts.append(self._get_attribute_string("style", style_value))
+        return "".join(parts)
 
     @staticmethod
     def _get_attribute_string(attribute, value):
-        escaped_value = escape(value, True)
+        escaped_value = escape_attribute(value)
         return " " + attribute + '="' + escaped_value + '"'
 
     @property
     def _class_value(self):
-        return " ".join(sorted(self._css_classes))
+        return " ".join(self._css_classes)
 
     @property
     def _style_value(self):
@@ -188,6 +256,8 @@ class _ElementDataProxy:
 
     """
 
+    __slots__ = ("_element",)
+
     def __init__(self, element):
         self._element = element
 
@@ -229,6 +299,43 @@ class _ElementDataProxy:
         return d
 
 
+class _AsyncChildren(Generator):
+
+    """The children returned by an asynchronous generate_children() method.
+
+    The children can be an asynchronous iterator or an awaitable. An
+    awaitable can return a generator or an iterable of children.
+
+    """
+
+    __slots__ = ("_children",)
+
+    def __init__(self, children):
+        super(_AsyncChildren, self).__init__()
+        self._children = children
+
+    def generate(self):
+        if inspect.iscoroutine(self._children):
+            # Avoid a warning about a coroutine that was never awaited.
+            self._children.close()
+        raise TypeError(
+            "asynchronous children can only be rendered asynchronously"
+        )
+
+    def agenerate(self):
+        if hasattr(self._children, "__anext__"):
+            return self._children
+        return self._await_children()
+
+    async def _await_children(self):
+        children = await self._children
+        if hasattr(children, "generate"):
+            return children
+        generator = ChildGenerator()
+        generator.extend(list(children))
+        return generator
+
+
 class NonVoidElement(ElementBase):
 
     """Base generator for non-void HTML elements.
@@ -242,12 +349,26 @@ class NonVoidElement(ElementBase):
         >>> str(element)
         '<div>Hello World!</div>'
 
+    generate_children() can also be asynchronous, for example by using
+    "async def generate_children()". Such elements can only be rendered
+    asynchronously, using arender() or aiter_text(), for example.
+
     """
 
+    __slots__ = ()
+
     def generate(self):
         yield self.render_start_tag() + ">"
-        for element in self.generate_children():
-            yield element
+        children = self.generate_children()
+        if hasattr(children, "generate"):
+            yield children
+        elif not hasattr(children, "__iter__") and (
+            hasattr(children, "__anext__") or inspect.isawaitable(children)
+        ):
+            yield _AsyncChildren(children)
+        else:
+            for element in children:
+                yield element
         yield "</" + self.element_name + ">"
 
     def generate_children(self):
@@ -305,6 +426,8 @@ class Element(NonVoidElement):
 
     """
 
+    __slots__ = ("children",)
+
     def __init__(self, element_name):
         super(Element, self).__init__(element_name)
         self.children = HTMLChildGenerator()
@@ -313,8 +436,70 @@ class Element(NonVoidElement):
         return True
 
     def __getattr__(self, item):
+        # Guard against infinite recursion while unpickling or copying,
+        # where children is not set, yet.
+        if item == "children":
+            raise AttributeError(item)
         return getattr(self.children, item)
 
+    # The following methods forward to self.children. They could be looked
+    # up using __getattr__(), but that is considerably slower.
+
+    def append(self, child):
+        """Append a string or sub generator.
+
+        Strings are escaped to be HTML-safe.
+
+        """
+        self.children.append(child)
+
+    def append_raw(self, child):
+        """Append a string or sub generator without escaping it.
+
+        Strings are NOT escaped! Therefore, you should use this method only
+        with HTML from trusted sources.
+
+        """
+        self.children.append_raw(child)
+
+    def extend(self, children):
+        """Append multiple strings and sub generators.
+
+        Strings are escaped to be HTML-safe.
+
+        """
+        self.children.extend(children)
+
+    def extend_raw(self, children):
+        """Append multiple strings and sub generators, without escaping them.
+
+        Strings are NOT escaped! Therefore, you should use this method only
+        with HTML from trusted sources.
+
+        """
+        self.children.extend_raw(children)
+
+    def remove(self, child):
+        """Remove a string or sub-generator.
+
+        Strings are HTML-escaped before trying to remove them. If the
+        string or sub-generator is not found, raises a ValueError.
+
+        """
+        self.children.remove(child)
+
+    def remove_raw(self, child):
+        """Remove a string or sub-generator without escaping it.
+
+        If the string or sub-generator is not found, raises a ValueError.
+
+        """
+        self.children.remove_raw(child)
+
+    def empty(self):
+        """Remove all children."""
+        self.children.empty()
+
     def __len__(self):
         """Return the number of children.
 
@@ -348,5 +533,7 @@ class VoidElement(ElementBase):
 
     """
 
+    __slots__ = ()
+
     def generate(self):
         yield self.render_start_tag() + "/>"
@@ -1,8 +1,17 @@
 import collections
 import typing
-from typing import Any, Mapping, Union, TypeVar, Set, Optional, overload
+from typing import (
+    Any,
+    Iterable,
+    Mapping,
+    Union,
+    TypeVar,
+    Set,
+    Optional,
+    overload,
+)
 
-from htmlgen.generator import Generator, HTMLChildGenerator
+from htmlgen.generator import GenValue, Generator, HTMLChildGenerator
 
 _T = TypeVar("_T")
 
@@ -53,6 +62,13 @@ class Element(NonVoidElement, collections.Sized):
     def __init__(self, element_name: str) -> None: ...
     def __bool__(self) -> bool: ...
     def __getattr__(self, item: str) -> Any: ...
+    def append(self, child: Optional[GenValue]) -> None: ...
+    def append_raw(self, child: GenValue) -> None: ...
+    def extend(self, children: Iterable[GenValue]) -> None: ...
+    def extend_raw(self, children: Iterable[GenValue]) -> None: ...
+    def remove(self, child: GenValue) -> None: ...
+    def remove_raw(self, child: GenValue) -> None: ...
+    def empty(self) -> None: ...
     def __len__(self) -> int: ...
     def __nonzero__(self) -> bool: ...
 
@@ -0,0 +1,164 @@
+# Strings up to this length are cached by the escaping functions.
+CACHE_MAX_LENGTH = 64
+
+# Maximum number of cached strings per function. When a cache is full, it is
+# cleared.
+CACHE_SIZE = 4096
+
+_conservative = False
+
+_cache = {}
+_text_cache = {}
+_attribute_cache = {}
+
+# Separates the strings of a list while escaping them in bulk. Lists with
+# strings that contain it are escaped one string at a time.
+_SEPARATOR = "\x00"
+
+
+def set_conservative_escaping(conservative):
+    """Select whether escape_text() and escape_attribute() escape all
+    reserved characters.
+
+    By default, escape_text() and escape_attribute() only escape the
+    characters that are necessary in their context. When conservative
+    escaping is enabled, they escape all characters that escape_html()
+    escapes, like previous versions of htmlgen did:
+
+        >>> set_conservative_escaping(True)
+        >>> escape_text("It's")
+        'It&#x27;s'
+        >>> set_conservative_escaping(False)
+        >>> escape_text("It's")
+        "It's"
+
+    Elements cache their rendered attributes, so this should be called
+    before any elements are rendered.
+
+    """
+    global _conservative
+    _conservative = conservative
+    _text_cache.clear()
+    _attribute_cache.clear()
+
+
+def escape_html(s):
+    """Replace reserved HTML characters in a string by character references.
+
+        >>> escape_html("Tom & Jerry's <Show>")
+        'Tom &amp; Jerry&#x27;s &lt;Show&gt;'
+
+    This is equivalent to html.escape(s), but strings without reserved
+    characters are returned unchanged, without copying them. Short strings
+    are cached, since the same values, for example status labels or CSS
+    class names, are often escaped over and over again.
+
+    """
+    if len(s) <= CACHE_MAX_LENGTH:
+        escaped = _cache.get(s)
+        if escaped is None:
+            escaped = _store(_cache, s, _escape(s))
+        return escaped
+    return _escape(s)
+
+
+def escape_text(s):
+    """Escape a string for use as text content of an element.
+
+    Only "&", "<", and ">" are replaced, quotes are left alone:
+
+        >>> escape_text("Tom & Jerry's \\"Show\\"")
+        'Tom &amp; Jerry\\'s "Show"'
+
+    Strings are cached like in escape_html().
+
+    """
+    if len(s) <= CACHE_MAX_LENGTH:
+        escaped = _text_cache.get(s)
+        if escaped is None:
+            escaped = _store(_text_cache, s, _escape_text(s))
+        return escaped
+    return _escape_text(s)
+
+
+def escape_text_list(values):
+    """Escape a list of strings for use as text content of elements.
+
+        >>> escape_text_list(["Tom & Jerry", "<Show>"])
+        ['Tom &amp; Jerry', '&lt;Show&gt;']
+
+    The strings are escaped like in escape_text(), but in bulk. This is
+    much faster than escaping each string separately, especially if no
+    string contains reserved characters. In that case, values itself is
+    returned. Strings are not cached.
+
+    """
+    joined = _SEPARATOR.join(values)
+    escaped = _escape_text(joined)
+    if escaped is joined:
+        return values
+    escaped_values = escaped.split(_SEPARATOR)
+    if len(escaped_values) != len(values):
+        return [_escape_text(value) for value in values]
+    return escaped_values
+
+
+def escape_attribute(s):
+    """Escape a string for use in a double-quoted attribute value.
+
+    Only "&" and double quotes are replaced:
+
+        >>> escape_attribute("a<b & \\"c\\"")
+        'a<b &amp; &quot;c&quot;'
+
+    Strings are cached like in escape_html().
+
+    """
+    if len(s) <= CACHE_MAX_LENGTH:
+        escaped = _attribute_cache.get(s)
+        if escaped is None:
+            escaped = _store(_attribute_cache, s, _escape_attribute(s))
+        return escaped
+    return _escape_attribute(s)
+
+
+def _store(cache, s, escaped):
+    if len(cache) >= CACHE_SIZE:
+        cache.clear()
+    cache[s] = escaped
+    return escaped
+
+
+# Checking for each character separately and using str.replace() is
+# considerably faster in CPython than using a regular expression or
+# str.translate().
+
+
+def _escape(s):
+    if "&" in s or "<" in s or ">" in s or '"' in s or "'" in s:
+        return (
+            s.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+            .replace("'", "&#x27;")
+        )
+    return s
+
+
+def _escape_text(s):
+    if _conservative:
+        return _escape(s)
+    if "&" in s or "<" in s or ">" in s:
+        return (
+            s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        )
+    return s
+
+
+def _escape_attribute(s):
+    if _conservative:
+        return _escape(s)
+    if "&" in s or '"' in s:
+        return s.replace("&", "&amp;").replace('"', "&quot;")
+    return s
@@ -0,0 +1,14 @@
+from typing import Dict, List
+
+CACHE_MAX_LENGTH: int
+CACHE_SIZE: int
+
+_cache: Dict[str, str]
+_text_cache: Dict[str, str]
+_attribute_cache: Dict[str, str]
+
+def set_conservative_escaping(conservative: bool) -> None: ...
+def escape_html(s: str) -> str: ...
+def escape_text(s: str) -> str: ...
+def escape_text_list(values: List[str]) -> List[str]: ...
+def escape_attribute(s: str) -> str: ...
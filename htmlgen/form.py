@@ -33,6 +33,8 @@ class Form(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, method="GET", url=""):
         super().__init__("form")
         self.method = method
@@ -70,6 +72,8 @@ class Input(VoidElement):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, type_="text", name=""):
         """Create an HTML input element.
 
@@ -106,6 +110,8 @@ class TextInput(Input):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name="", value=""):
         """Create an HTML text input element.
 
@@ -122,6 +128,8 @@ class TextInput(Input):
 class SearchInput(Input):
     """An HTML search (<input type="search">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name=""):
         """Create an HTML search element.
 
@@ -135,6 +143,8 @@ class SearchInput(Input):
 class PasswordInput(Input):
     """An HTML password input (<input type="password">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name=""):
         """Create an HTML password input element.
 
@@ -148,6 +158,8 @@ class PasswordInput(Input):
 class NumberInput(Input):
     """An HTML number input (<input type="number">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name="", number=None):
         """Create an HTML number input element.
 
@@ -171,6 +183,8 @@ class NumberInput(Input):
 class DateInput(Input):
     """An HTML date input (<input type="date">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name="", date=None):
         """Create an HTML date element.
 
@@ -212,6 +226,8 @@ class DateInput(Input):
 class TimeInput(Input):
     """An HTML time input (<input type="time">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name="", time=None):
         """Create an HTML time element.
 
@@ -281,6 +297,8 @@ class TimeInput(Input):
 
 
 class _CheckableInput(Input):
+    __slots__ = ()
+
     def __init__(self, type_, name, value):
         super(_CheckableInput, self).__init__(type_, name)
         if value:
@@ -297,6 +315,8 @@ class Checkbox(_CheckableInput):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name="", value=""):
         super(Checkbox, self).__init__("checkbox", name, value)
 
@@ -309,6 +329,8 @@ class RadioButton(_CheckableInput):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name="", value=""):
         super(RadioButton, self).__init__("radio", name, value)
 
@@ -316,6 +338,8 @@ class RadioButton(_CheckableInput):
 class FileInput(Input):
     """An HTML file input (<input type="file">) element."""
 
+    __slots__ = ()
+
     def __init__(self, name=""):
         super(FileInput, self).__init__("file", name)
 
@@ -326,6 +350,8 @@ class FileInput(Input):
 class HiddenInput(Input):
     """A hidden HTML input (<input type="hidden"/>) element."""
 
+    __slots__ = ()
+
     def __init__(self, name, value):
         super(HiddenInput, self).__init__("hidden", name)
         self.value = value
@@ -345,6 +371,8 @@ class SubmitButton(Input):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, label):
         super(SubmitButton, self).__init__("submit")
         self.value = label
@@ -365,6 +393,8 @@ class Button(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Button, self).__init__("button")
         self.extend(content)
@@ -381,6 +411,8 @@ class TextArea(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name=""):
         super().__init__("textarea")
         self.name = name
@@ -419,6 +451,8 @@ class Select(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, name=""):
         super().__init__("select")
         self.name = name
@@ -505,6 +539,8 @@ class Select(Element):
 class OptionGroup(Element):
     """An HTML selection list option group (<optgroup>) element."""
 
+    __slots__ = ()
+
     def __init__(self, label):
         super(OptionGroup, self).__init__("optgroup")
         self.label = label
@@ -531,6 +567,8 @@ class Option(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, label, value=None):
         super(Option, self).__init__("option")
         self.value = value
@@ -572,6 +610,8 @@ class Label(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *children):
         super(Label, self).__init__("label")
         self.extend(children)
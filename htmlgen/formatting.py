@@ -0,0 +1,101 @@
+import sys
+
+from htmlgen.escaping import escape_text, escape_text_list
+
+
+def format_strings(values):
+    """Escape a sequence of strings in bulk.
+
+        >>> format_strings(["Tom & Jerry", "<Show>"])
+        ['Tom &amp; Jerry', '&lt;Show&gt;']
+
+    Return a list of HTML-escaped strings. This is much faster than
+    escaping each string separately, especially if no string contains
+    reserved HTML characters.
+
+    This function can be used as a column formatter for ColumnarTableBody.
+
+    """
+    return escape_text_list(_to_list(values))
+
+
+def format_decimals(
+    values, decimals=2, thousands_separator="", decimal_separator="."
+):
+    """Format a sequence of numbers with a fixed number of decimals.
+
+        >>> format_decimals([1234.5, -0.125, 7])
+        ['1234.50', '-0.12', '7.00']
+        >>> format_decimals([1234567.891], 1, thousands_separator=",")
+        ['1,234,567.9']
+        >>> format_decimals(
+        ...     [1234567.891], thousands_separator=".", decimal_separator=","
+        ... )
+        ['1.234.567,89']
+
+    Return a list of HTML-escaped strings. values can contain any objects
+    that support the "f" format, like int, float, and decimal.Decimal.
+    NumPy arrays are converted to lists before formatting. A ValueError is
+    raised if both separators are the same.
+
+    This function can be used as a column formatter for ColumnarTableBody,
+    for example using functools.partial().
+
+    """
+    if thousands_separator == decimal_separator:
+        raise ValueError("thousands and decimal separators must differ")
+    values = _to_list(values)
+    if thousands_separator:
+        format_ = "{:,.%df}" % decimals
+    else:
+        format_ = "{:.%df}" % decimals
+    formatted = list(map(format_.format, values))
+    if (thousands_separator and thousands_separator != ",") or (
+        decimal_separator != "."
+    ):
+        # Both separators are replaced at once, so that they can be swapped.
+        separators = {
+            ord(","): escape_text(thousands_separator),
+            ord("."): escape_text(decimal_separator),
+        }
+        formatted = [s.translate(separators) for s in formatted]
+    return formatted
+
+
+def format_dates(values):
+    """Format a sequence of dates in ISO 8601 format.
+
+        >>> import datetime
+        >>> format_dates([datetime.date(2020, 1, 31)])
+        ['2020-01-31']
+
+    Return a list of HTML-escaped strings. date and datetime objects are
+    formatted using their isoformat() method. NumPy datetime64 arrays are
+    formatted using numpy.datetime_as_string().
+
+    This function can be used as a column formatter for ColumnarTableBody.
+
+    """
+    numpy = _numpy_for(values)
+    if numpy is not None and values.dtype.kind == "M":
+        return numpy.datetime_as_string(values).tolist()
+    return [value.isoformat() for value in values]
+
+
+def _to_list(values):
+    # Formatting NumPy scalars is much slower than formatting the
+    # corresponding Python objects.
+    if _numpy_for(values) is not None:
+        return values.tolist()
+    if type(values) is not list:
+        return list(values)
+    return values
+
+
+def _numpy_for(values):
+    # NumPy is not imported here: if it was not imported, yet, values can
+    # not be a NumPy array.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy
+    return None
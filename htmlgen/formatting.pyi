@@ -0,0 +1,10 @@
+from typing import Any, Iterable, List
+
+def format_strings(values: Iterable[str]) -> List[str]: ...
+def format_decimals(
+    values: Iterable[Any],
+    decimals: int = ...,
+    thousands_separator: str = ...,
+    decimal_separator: str = ...,
+) -> List[str]: ...
+def format_dates(values: Iterable[Any]) -> List[str]: ...
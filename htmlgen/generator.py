@@ -1,15 +1,7 @@
-import sys
 from typing import Union, Generator as GeneratorType
 
-if sys.version_info[0] < 3:
-    from cgi import escape
-else:
-    from html import escape
-
-
-# TODO: Python 3: remove
-if sys.version_info[0] >= 3:
-    unicode = str
+from htmlgen.asynchronous import AsyncFlattener, concurrent_children
+from htmlgen.escaping import escape_text
 
 
 class Generator(object):
@@ -31,13 +23,16 @@ class Generator(object):
         [b'Foo', b'XXX']
 
     __str__() returns a concatenated version of the strings returned by
-    __iter__():
+    iter_text(), which works like __iter__(), but returns str objects without
+    a round trip through UTF-8:
 
         >>> str(generator)
         'FooXXX'
 
     """
 
+    __slots__ = ("__weakref__",)
+
     def __iter__(self):
         """Return a flat iterator over the elements returned by generate().
 
@@ -45,26 +40,256 @@ class Generator(object):
         flattened, Unicode strings are UTF-8 encoded.
 
         """
-        self._iterator_stack = [self.generate()]
-        while self._iterator_stack:
-            iterator = self._iterator_stack[-1]
-            try:
-                item = next(iterator)
-            except StopIteration:
-                self._iterator_stack.pop()
+        return self._flatten(text=False)
+
+    def __str__(self):
+        """Return a concatenation of the strings returned by iter_text()."""
+        return self.render()
+
+    def iter_text(self):
+        """Return a flat iterator over the elements returned by generate().
+
+        Unlike __iter__(), iter_text() returns str objects. Unicode strings
+        are returned as is, only byte strings are decoded from UTF-8:
+
+            >>> generator = IteratorGenerator(["Foo", b"Bar"])
+            >>> list(generator.iter_text())
+            ['Foo', 'Bar']
+
+        """
+        return self._flatten(text=True)
+
+    def iter_with_markers(self, text, marker_classes):
+        """Return a flat iterator that stops flattening at marker generators.
+
+        This works like __iter__() - or like iter_text() if text is True -
+        but generators that are instances of one of marker_classes are
+        returned as is, instead of being flattened:
+
+            >>> class Marker(NullGenerator):
+            ...     pass
+            >>> marker = Marker()
+            >>> generator = IteratorGenerator(["Foo", marker, b"Bar"])
+            >>> items = list(generator.iter_with_markers(True, (Marker,)))
+            >>> items[0], items[1] is marker, items[2]
+            ('Foo', True, 'Bar')
+
+        This can be used to pre-render a tree, while leaving placeholders
+        for parts that are rendered later.
+
+        """
+        return self._flatten(text, tuple(marker_classes))
+
+    def render(self):
+        """Return the generated HTML as a string.
+
+            >>> IteratorGenerator(["<b>", "Foo", b"</b>"]).render()
+            '<b>Foo</b>'
+
+        """
+        return "".join(self._flatten(text=True))
+
+    def iter_chunks(self, min_size=16384):
+        """Return an iterator over UTF-8 encoded chunks of generated HTML.
+
+        Unlike __iter__(), which returns one byte string per generated
+        string, iter_chunks() collects strings until at least min_size
+        bytes are available. This reduces the number of writes when the
+        iterator is returned from a WSGI application.
+
+            >>> generator = IteratorGenerator(["<p>", "Foo", "</p>"])
+            >>> list(generator.iter_chunks(min_size=4))
+            [b'<p>Foo', b'</p>']
+
+        A FlushGenerator forces a chunk boundary, even if the current chunk
+        is smaller than min_size:
+
+            >>> generator = IteratorGenerator(["Foo", FlushGenerator(), "Bar"])
+            >>> list(generator.iter_chunks())
+            [b'Foo', b'Bar']
+
+        """
+        buffer = bytearray()
+        for fragment in self._flatten(False, (FlushGenerator,)):
+            if isinstance(fragment, FlushGenerator):
+                if buffer:
+                    yield bytes(buffer)
+                    del buffer[:]
+            elif not buffer and len(fragment) >= min_size:
+                yield fragment
             else:
-                if hasattr(item, "generate"):
-                    self._iterator_stack.append(item.generate())
-                elif isinstance(item, bytes):
-                    yield item
-                elif isinstance(item, unicode):
-                    yield item.encode("utf-8")
+                buffer += fragment
+                if len(buffer) >= min_size:
+                    yield bytes(buffer)
+                    del buffer[:]
+        if buffer:
+            yield bytes(buffer)
+
+    def write_to(self, fp, min_size=16384):
+        """Write the generated HTML UTF-8 encoded to a binary file object.
+
+            >>> import io
+            >>> fp = io.BytesIO()
+            >>> IteratorGenerator(["<p>", "Foo", "</p>"]).write_to(fp)
+            >>> fp.getvalue()
+            b'<p>Foo</p>'
+
+        fp can be any object with a write() method. If it also provides
+        a writelines() method, that is used instead. The generated HTML is
+        written in chunks of at least min_size bytes, as returned by
+        iter_chunks(). If min_size is None, every generated string is
+        written separately.
+
+        """
+        if min_size is None:
+            fragments = iter(self)
+        else:
+            fragments = self.iter_chunks(min_size)
+        _write_fragments(fp, fragments)
+
+    def write_text_to(self, fp):
+        """Write the generated HTML to a text file object.
+
+            >>> import io
+            >>> fp = io.StringIO()
+            >>> IteratorGenerator(["<p>", "Foo", "</p>"]).write_text_to(fp)
+            >>> fp.getvalue()
+            '<p>Foo</p>'
+
+        fp can be any object with a write() method. If it also provides
+        a writelines() method, that is used instead.
+
+        """
+        _write_fragments(fp, self.iter_text())
+
+    def freeze(self):
+        """Render this generator and return an immutable FrozenGenerator.
+
+        This is useful for static parts of a page, that are constructed
+        once, but rendered many times:
+
+            >>> generator = ChildGenerator()
+            >>> generator.extend(["<p>", "Footer", "</p>"])
+            >>> frozen = generator.freeze()
+            >>> generator.append("Changed")
+            >>> list(iter(frozen))
+            [b'<p>Footer</p>']
+
+        """
+        return FrozenGenerator(self.render())
+
+    def __aiter__(self):
+        """Return an asynchronous iterator over UTF-8 encoded byte strings.
+
+        This works like __iter__(), but generate() and agenerate() methods
+        can return asynchronous iterators and awaitables, and control is
+        regularly given back to the event loop:
+
+            >>> import asyncio
+            >>> class AsyncGenerator(Generator):
+            ...     async def generate(self):
+            ...         await asyncio.sleep(0)
+            ...         return IteratorGenerator(["Foo", b"Bar"])
+            >>> async def collect():
+            ...     fragments = []
+            ...     async for fragment in AsyncGenerator():
+            ...         fragments.append(fragment)
+            ...     return fragments
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(collect())
+            [b'FooBar']
+            >>> loop.close()
+
+        Synchronous generators can be used as part of asynchronous trees.
+        The strings they generate are joined into larger batches.
+
+        """
+        return AsyncFlattener(self, text=False)
+
+    def aiter_text(self, max_concurrency=None):
+        """Return an asynchronous iterator over str objects.
+
+        This works like __aiter__(), but returns str objects, like
+        iter_text().
+
+        Asynchronous children of ChildGenerator and HTMLChildGenerator
+        objects - and therefore of elements - are rendered concurrently,
+        also if they are wrapped in other elements. max_concurrency limits
+        the number of children rendered at the same time. See
+        AsyncFlattener for details.
+
+        """
+        return AsyncFlattener(self, text=True, max_concurrency=max_concurrency)
+
+    async def arender(self, max_concurrency=None):
+        """Asynchronously render the generated HTML to a string.
+
+            >>> import asyncio
+            >>> generator = IteratorGenerator(["Foo", b"Bar"])
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(generator.arender())
+            'FooBar'
+            >>> loop.close()
+
+        max_concurrency works as in aiter_text().
+
+        """
+        fragments = []
+        flattener = self.aiter_text(max_concurrency)
+        try:
+            async for fragment in flattener:
+                fragments.append(fragment)
+        finally:
+            await flattener.aclose()
+        return "".join(fragments)
+
+    def _flatten(self, text, passthrough=()):
+        # Instances of the classes in passthrough are returned as is,
+        # instead of being flattened.
+        #
+        # The iterator stack is local to this iteration, so that a
+        # generator can be iterated several times at once, for example
+        # from multiple threads.
+        #
+        # This is the hottest loop of htmlgen. Items are dispatched on their
+        # exact type, with the most common types - str and bytes - first.
+        # The kind of all other types is looked up in a per-class cache.
+        # hasattr() is only used for objects whose class has no generate()
+        # method.
+        kinds = _item_kinds
+        iterator_stack = [iter(self.generate())]
+        push = iterator_stack.append
+        while iterator_stack:
+            for item in iterator_stack[-1]:
+                item_type = type(item)
+                if item_type is str:
+                    yield item if text else item.encode("utf-8")
+                    continue
+                if item_type is bytes:
+                    yield item.decode("utf-8") if text else item
+                    continue
+                kind = kinds.get(item_type)
+                if kind is None:
+                    kind = _item_kind(item_type)
+                if kind is _KIND_GENERATOR:
+                    if passthrough and isinstance(item, passthrough):
+                        yield item
+                        continue
+                    push(iter(item.generate()))
+                    break
+                elif kind is _KIND_FROZEN:
+                    yield item.text if text else item.encoded
+                elif kind is _KIND_STR:
+                    yield str(item) if text else item.encode("utf-8")
+                elif kind is _KIND_BYTES:
+                    yield bytes(item).decode("utf-8") if text else bytes(item)
+                elif hasattr(item, "generate"):
+                    push(iter(item.generate()))
+                    break
                 else:
                     raise TypeError("can not generate {}".format(repr(item)))
-
-    def __str__(self):
-        """Return a concatenation of the strings returned by __iter__()."""
-        return "".join(s.decode("utf-8") for s in self)
+            else:
+                iterator_stack.pop()
 
     def generate(self):
         """To be overridden by sub-classes. Return an iterator over strings,
@@ -73,15 +298,135 @@ class Generator(object):
         """
         raise NotImplementedError()
 
+    def agenerate(self):
+        """Return an iterator used for asynchronous rendering.
+
+        By default, this returns the iterator returned by generate().
+        Sub-classes can override this method to return an asynchronous
+        iterator, while keeping a synchronous generate() method.
+
+        """
+        return self.generate()
+
+
+_KIND_GENERATOR = "generator"
+_KIND_FROZEN = "frozen"
+_KIND_STR = "str"
+_KIND_BYTES = "bytes"
+_KIND_OTHER = "other"
+
+# Cache of the kinds of item types generated by generate() methods. The
+# cache is cleared when it is full, so that classes created at runtime are
+# not kept alive forever.
+_item_kinds = {}
+_ITEM_KINDS_SIZE = 1024
+
+
+def _item_kind(item_type):
+    if issubclass(item_type, FrozenGenerator):
+        kind = _KIND_FROZEN
+    elif hasattr(item_type, "generate"):
+        kind = _KIND_GENERATOR
+    elif issubclass(item_type, str):
+        kind = _KIND_STR
+    elif issubclass(item_type, bytes):
+        kind = _KIND_BYTES
+    else:
+        # Not cached, since the class could gain a generate() method later.
+        return _KIND_OTHER
+    if len(_item_kinds) >= _ITEM_KINDS_SIZE:
+        _item_kinds.clear()
+    _item_kinds[item_type] = kind
+    return kind
+
+
+def _write_fragments(fp, fragments):
+    writelines = getattr(fp, "writelines", None)
+    if writelines is not None:
+        writelines(fragments)
+    else:
+        for fragment in fragments:
+            fp.write(fragment)
+
 
 class NullGenerator(Generator):
 
     """A generator that generates nothing."""
 
+    __slots__ = ()
+
     def generate(self):
         return iter([])
 
 
+class FlushGenerator(NullGenerator):
+
+    """A generator that marks a chunk boundary.
+
+    FlushGenerator does not generate any output, but Generator.iter_chunks()
+    will end the current chunk when it encounters a FlushGenerator. This
+    can be used to send the beginning of a page to the client, before
+    starting expensive operations:
+
+        >>> generator = ChildGenerator()
+        >>> generator.extend(["<head>", "</head>", FlushGenerator(), "<body>"])
+        >>> list(generator.iter_chunks())
+        [b'<head></head>', b'<body>']
+
+    """
+
+    __slots__ = ()
+
+
+class FrozenGenerator(Generator):
+
+    """An immutable generator for pre-rendered HTML.
+
+    FrozenGenerator stores the HTML both as str and as UTF-8 encoded bytes.
+    It is generated as a single string, without any escaping:
+
+        >>> frozen = FrozenGenerator("<p>Foo</p>")
+        >>> list(iter(frozen))
+        [b'<p>Foo</p>']
+        >>> frozen.text
+        '<p>Foo</p>'
+
+    FrozenGenerator objects can not be changed and can therefore be shared
+    between threads:
+
+        >>> frozen.text = "<p>Bar</p>"
+        Traceback (most recent call last):
+            ...
+        AttributeError: FrozenGenerator objects are immutable
+
+    Use Generator.freeze() to create a FrozenGenerator from an existing
+    generator.
+
+    """
+
+    __slots__ = ("text", "encoded")
+
+    def __init__(self, text):
+        super(FrozenGenerator, self).__init__()
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "encoded", text.encode("utf-8"))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenGenerator objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenGenerator objects are immutable")
+
+    def __reduce__(self):
+        return FrozenGenerator, (self.text,)
+
+    def freeze(self):
+        return self
+
+    def generate(self):
+        yield self.encoded
+
+
 class IteratorGenerator(Generator):
 
     """A generator that generates an item per item of an iterator.
@@ -92,6 +437,8 @@ class IteratorGenerator(Generator):
 
     """
 
+    __slots__ = ("_iterator",)
+
     def __init__(self, iterator):
         super(IteratorGenerator, self).__init__()
         self._iterator = iterator
@@ -118,6 +465,8 @@ class ChildGenerator(Generator):
 
     """
 
+    __slots__ = ("_children",)
+
     def __init__(self):
         super(ChildGenerator, self).__init__()
         self._children = []
@@ -168,6 +517,15 @@ class ChildGenerator(Generator):
         """
         return iter(self._children)
 
+    def agenerate(self):
+        """Return the children for asynchronous rendering.
+
+        Children with asynchronous generate() or agenerate() methods
+        are rendered concurrently, but their output is generated in order.
+
+        """
+        return concurrent_children(self.generate())
+
 
 class HTMLChildGenerator(Generator):
 
@@ -202,9 +560,11 @@ class HTMLChildGenerator(Generator):
 
     """
 
+    __slots__ = ("_children",)
+
     def __init__(self):
         super(HTMLChildGenerator, self).__init__()
-        self._children = ChildGenerator()
+        self._children = []
 
     def __len__(self):
         """Return the number of children.
@@ -221,7 +581,7 @@ class HTMLChildGenerator(Generator):
 
         """
         if not hasattr(child, "generate"):
-            child = escape(child)
+            child = escape_text(child)
         self.append_raw(child)
 
     def append_raw(self, child):
@@ -231,6 +591,8 @@ class HTMLChildGenerator(Generator):
         with HTML from trusted sources.
 
         """
+        if child is None:
+            raise TypeError("child can not be None")
         self._children.append(child)
 
     def extend(self, children):
@@ -264,7 +626,7 @@ class HTMLChildGenerator(Generator):
         """
         # if not hasattr(child, "generate"):
         if not hasattr(child, "generate"):
-            child = escape(child)
+            child = escape_text(child)
         self._children.remove(child)
 
     def remove_raw(self, child):
@@ -281,7 +643,7 @@ class HTMLChildGenerator(Generator):
 
     def empty(self):
         """Remove all children."""
-        self._children.empty()
+        self._children = []
 
     @property
     def children(self):
@@ -290,7 +652,7 @@ class HTMLChildGenerator(Generator):
         String children are already HTML-escaped.
 
         """
-        return self._children.children
+        return self._children[:]
 
     def generate(self):
         """Return an iterator over all children, in order.
@@ -299,7 +661,16 @@ class HTMLChildGenerator(Generator):
         if desired.
 
         """
-        return self._children.generate()
+        return iter(self._children)
+
+    def agenerate(self):
+        """Return the children for asynchronous rendering.
+
+        Children with asynchronous generate() or agenerate() methods
+        are rendered concurrently, but their output is generated in order.
+
+        """
+        return concurrent_children(self.generate())
 
 
 def generate_html_string(s):
@@ -348,6 +719,8 @@ class JoinGenerator(ChildGenerator):
 
     """
 
+    __slots__ = ("_glue",)
+
     def __init__(self, glue, pieces=None):
         super(JoinGenerator, self).__init__()
         self._glue = glue
@@ -380,9 +753,11 @@ class HTMLJoinGenerator(HTMLChildGenerator):
 
     """
 
+    __slots__ = ("_glue",)
+
     def __init__(self, glue, pieces=None):
         super(HTMLJoinGenerator, self).__init__()
-        self._glue = escape(glue)
+        self._glue = escape_text(glue)
         if pieces:
             self.extend(pieces)
 
@@ -1,18 +1,46 @@
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     Union,
     Iterator,
     Optional,
     List,
     Iterable,
+    Type,
     Generator as GeneratorType,
 )
 
+_item_kinds: Dict[type, str]
+_ITEM_KINDS_SIZE: int
+
 class Generator(object):
     def __iter__(self) -> Iterator[bytes]: ...
     def __str__(self) -> str: ...
+    def iter_text(self) -> Iterator[str]: ...
+    def iter_with_markers(
+        self, text: bool, marker_classes: Iterable[Type[Generator]]
+    ) -> Iterator[Union[str, bytes, Generator]]: ...
+    def render(self) -> str: ...
+    def iter_chunks(self, min_size: int = ...) -> Iterator[bytes]: ...
+    def write_to(self, fp: Any, min_size: Optional[int] = ...) -> None: ...
+    def write_text_to(self, fp: Any) -> None: ...
+    def freeze(self) -> FrozenGenerator: ...
+    def __aiter__(self) -> AsyncIterator[bytes]: ...
+    def aiter_text(
+        self, max_concurrency: Optional[int] = ...
+    ) -> AsyncIterator[str]: ...
+    async def arender(self, max_concurrency: Optional[int] = ...) -> str: ...
     def generate(self) -> GenValueGenerator: ...
+    def agenerate(self) -> Any: ...
 
 class NullGenerator(Generator): ...
+class FlushGenerator(NullGenerator): ...
+
+class FrozenGenerator(Generator):
+    text: str
+    encoded: bytes
+    def __init__(self, text: str) -> None: ...
 
 class IteratorGenerator(Generator):
     def __init__(self, iterator: Iterable[GenValue]) -> None: ...
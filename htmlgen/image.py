@@ -20,6 +20,8 @@ class Image(VoidElement):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, url, alternate_text=""):
         super(Image, self).__init__("img")
         self.url = url
@@ -14,6 +14,8 @@ class Span(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Span, self).__init__("span")
         self.extend(content)
@@ -42,6 +44,8 @@ class Highlight(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Highlight, self).__init__("b")
         self.extend(content)
@@ -59,6 +63,8 @@ class Strong(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Strong, self).__init__("strong")
         self.extend(content)
@@ -84,6 +90,8 @@ class Alternate(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Alternate, self).__init__("i")
         self.extend(content)
@@ -103,6 +111,8 @@ class Emphasis(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Emphasis, self).__init__("em")
         self.extend(content)
@@ -121,6 +131,8 @@ class Small(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(Small, self).__init__("small")
         self.extend(content)
@@ -130,5 +142,7 @@ class LineBreak(VoidElement):
 
     """An HTML line break (<br>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(LineBreak, self).__init__("br")
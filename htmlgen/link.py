@@ -30,6 +30,8 @@ class Link(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, url, *content):
         super(Link, self).__init__("a")
         self.url = url
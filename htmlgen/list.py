@@ -6,6 +6,8 @@ class _ListBase(Element):
 
     """Base class for HTML list elements."""
 
+    __slots__ = ()
+
     def create_item(self, child=None):
         """Create a ListItem element and add it to this list."""
         item = ListItem()
@@ -35,6 +37,8 @@ class OrderedList(_ListBase):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(OrderedList, self).__init__("ol")
 
@@ -54,6 +58,8 @@ class UnorderedList(_ListBase):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(UnorderedList, self).__init__("ul")
 
@@ -66,6 +72,8 @@ class ListItem(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(ListItem, self).__init__("li")
         self.extend(content)
@@ -86,6 +94,8 @@ class DescriptionList(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(DescriptionList, self).__init__("dl")
 
@@ -106,6 +116,8 @@ class DescriptionTerm(Element):
 
     """An HTML term element (<dt>) for description lists."""
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(DescriptionTerm, self).__init__("dt")
         self.extend(content)
@@ -115,6 +127,8 @@ class DescriptionDefinition(Element):
 
     """An HTML definition element (<dd>) for description lists."""
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(DescriptionDefinition, self).__init__("dd")
         self.extend(content)
@@ -0,0 +1,103 @@
+from htmlgen.generator import Generator
+
+
+class ParallelGenerator(Generator):
+
+    """Mark a sub-generator to be rendered in parallel.
+
+    When rendered normally, a ParallelGenerator generates the wrapped
+    generator:
+
+        >>> from htmlgen import Division
+        >>> str(ParallelGenerator(Division("Foo")))
+        '<div>Foo</div>'
+
+    render_parallel() and iter_parallel() render the wrapped generators
+    of all ParallelGenerator objects in a tree concurrently. See
+    render_parallel() for details.
+
+    """
+
+    __slots__ = ("generator",)
+
+    def __init__(self, generator):
+        super(ParallelGenerator, self).__init__()
+        self.generator = generator
+
+    def generate(self):
+        yield self.generator
+
+
+def render_parallel(generator, executor):
+    """Render a generator tree, rendering marked sub-trees in parallel.
+
+    Return the UTF-8 encoded HTML. Sub-generators wrapped in a
+    ParallelGenerator are submitted to executor - a
+    concurrent.futures.Executor - and their output is inserted in
+    document order:
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from htmlgen import Table, TableBody
+        >>> table = Table()
+        >>> for i in range(2):
+        ...     body = TableBody()
+        ...     cell = body.create_row().create_cell(str(i))
+        ...     table.append(ParallelGenerator(body))
+        >>> with ThreadPoolExecutor() as executor:
+        ...     render_parallel(table, executor)
+        b'<table><tbody><tr><td>0</td></tr></tbody><tbody><tr><td>1</td></tr></tbody></table>'
+
+    When using a ProcessPoolExecutor, the wrapped generators must be
+    picklable. Mark only large sub-trees, since every marked sub-tree
+    incurs the overhead of the executor and, for processes, of
+    serializing the sub-tree.
+
+    """
+    return b"".join(iter_parallel(generator, executor))
+
+
+def iter_parallel(generator, executor):
+    """Return an iterator over UTF-8 encoded HTML, rendered in parallel.
+
+    This works like render_parallel(), but returns the generated HTML in
+    pieces. All marked sub-trees are submitted before the first piece is
+    returned.
+
+    """
+    segments = _submit_segments(generator, executor)
+    try:
+        for segment in segments:
+            if isinstance(segment, bytes):
+                yield segment
+            else:
+                yield segment.result()
+    finally:
+        for segment in segments:
+            if not isinstance(segment, bytes):
+                segment.cancel()
+
+
+def _submit_segments(generator, executor):
+    segments = []
+    fragments = []
+    try:
+        for item in generator.iter_with_markers(False, [ParallelGenerator]):
+            if isinstance(item, ParallelGenerator):
+                if fragments:
+                    segments.append(b"".join(fragments))
+                    fragments = []
+                segments.append(executor.submit(_render, item.generator))
+            else:
+                fragments.append(item)
+    except BaseException:
+        for segment in segments:
+            if not isinstance(segment, bytes):
+                segment.cancel()
+        raise
+    if fragments:
+        segments.append(b"".join(fragments))
+    return segments
+
+
+def _render(generator):
+    return b"".join(generator)
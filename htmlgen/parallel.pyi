@@ -0,0 +1,13 @@
+from concurrent.futures import Executor
+from typing import Iterator
+
+from htmlgen.generator import Generator
+
+class ParallelGenerator(Generator):
+    generator: Generator
+    def __init__(self, generator: Generator) -> None: ...
+
+def render_parallel(generator: Generator, executor: Executor) -> bytes: ...
+def iter_parallel(
+    generator: Generator, executor: Executor
+) -> Iterator[bytes]: ...
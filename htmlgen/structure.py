@@ -9,6 +9,8 @@ class Section(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Section, self).__init__("section")
 
@@ -22,6 +24,8 @@ class Article(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Article, self).__init__("article")
 
@@ -30,6 +34,8 @@ class Navigation(Element):
 
     """An HTML navigation container (<nav>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(Navigation, self).__init__("nav")
 
@@ -39,6 +45,8 @@ class Aside(Element):
     """An HTML element for tangential related content (<aside>).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Aside, self).__init__("aside")
 
@@ -52,6 +60,8 @@ class Header(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Header, self).__init__("header")
 
@@ -64,6 +74,8 @@ class Footer(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Footer, self).__init__("footer")
 
@@ -87,6 +99,8 @@ class Heading(Element):
 
     """
 
+    __slots__ = ("level",)
+
     def __init__(self, level=1, *content):
         if level < 1 or level > 6:
             raise TypeError("heading level must be between 1 and 6")
@@ -1,5 +1,16 @@
+import asyncio
+from collections.abc import Mapping
+from functools import partial
+
 from htmlgen.attribute import int_html_attribute
-from htmlgen.element import Element
+from htmlgen.cache import CachedFragment, fragment_cache
+from htmlgen.element import Element, NonVoidElement
+from htmlgen.escaping import escape_text
+from htmlgen.generator import Generator
+from htmlgen.template import split_at_slots
+
+# Number of rows of a ColumnarTableBody that are rendered at once.
+ROWS_PER_BATCH = 1000
 
 
 class Table(Element):
@@ -40,6 +51,8 @@ class Table(Element):
 
     """
 
+    __slots__ = ("_head", "_body")
+
     def __init__(self):
         super(Table, self).__init__("table")
         self._head = TableHead()
@@ -155,6 +168,104 @@ class Table(Element):
         row.create_header_cells(*headers)
         return row
 
+    @classmethod
+    def from_columns(cls, columns, formatters=None):
+        """Create a table from a mapping of column names to sequences.
+
+            >>> table = Table.from_columns(
+            ...     {"Name": ["Apple", "Pear"], "Price": [1.5, 2]}
+            ... )
+            >>> str(table)
+            '<table><thead><tr><th>Name</th><th>Price</th></tr></thead><tbody><tr><td>Apple</td><td>1.5</td></tr><tr><td>Pear</td><td>2</td></tr></tbody></table>'
+
+        The column names are used for a header row. The rows are rendered
+        by a ColumnarTableBody, see there for details. formatters can map
+        column names to column formatters:
+
+            >>> from htmlgen.formatting import format_decimals
+            >>> table = Table.from_columns(
+            ...     {"Price": [1.5, 2]}, formatters={"Price": format_decimals}
+            ... )
+            >>> str(table)
+            '<table><thead><tr><th>Price</th></tr></thead><tbody><tr><td>1.50</td></tr><tr><td>2.00</td></tr></tbody></table>'
+
+        """
+        table = cls()
+        table.create_simple_header_row(*columns.keys())
+        if formatters is None:
+            formatters = {}
+        unknown = set(formatters) - set(columns)
+        if unknown:
+            raise ValueError(
+                "formatters for unknown columns: " + ", ".join(sorted(unknown))
+            )
+        table.append(
+            ColumnarTableBody(
+                list(columns.values()),
+                [formatters.get(name) for name in columns],
+            )
+        )
+        return table
+
+    @classmethod
+    def from_async_rows(
+        cls, rows, columns=None, formatters=None, batch_size=ROWS_PER_BATCH
+    ):
+        """Create a table from an asynchronous iterator over rows.
+
+        The rows are rendered by an AsyncTableBody, see there for details.
+        Such a table can only be rendered asynchronously:
+
+            >>> import asyncio
+            >>> class Rows:
+            ...     def __init__(self, rows):
+            ...         self._rows = iter(rows)
+            ...     def __aiter__(self):
+            ...         return self
+            ...     async def __anext__(self):
+            ...         for row in self._rows:
+            ...             return row
+            ...         raise StopAsyncIteration()
+            >>> rows = Rows([{"Name": "Apple", "Price": 1.5}])
+            >>> table = Table.from_async_rows(rows, ["Name", "Price"])
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(table.arender())
+            '<table><thead><tr><th>Name</th><th>Price</th></tr></thead><tbody><tr><td>Apple</td><td>1.5</td></tr></tbody></table>'
+            >>> loop.close()
+
+        If columns is given, it is used for a header row. Rows can be
+        sequences or mappings. The values of mappings are looked up using
+        the column names. formatters can map column names to column
+        formatters, like in from_columns().
+
+        """
+        table = cls()
+        if formatters is None:
+            formatters = {}
+        if columns is not None:
+            columns = list(columns)
+            table.create_simple_header_row(*columns)
+            unknown = set(formatters) - set(columns)
+            if unknown:
+                raise ValueError(
+                    "formatters for unknown columns: "
+                    + ", ".join(sorted(unknown))
+                )
+            body_formatters = [formatters.get(name) for name in columns]
+        elif formatters:
+            raise ValueError("formatters require column names")
+        else:
+            body_formatters = None
+        table.append(
+            AsyncTableBody(
+                rows,
+                columns,
+                formatters=body_formatters,
+                batch_size=batch_size,
+            )
+        )
+        return table
+
     def create_simple_row(self, *cells):
         """Create a TableRow with text cells and append it to the table.
 
@@ -172,23 +283,21 @@ class Table(Element):
     def generate_children(self):
         if self._head.children:
             yield self._head
-        head = TableHead()
-        head.extend(self.generate_header_rows())
-        if len(head):
-            yield head
+        header_rows = self.generate_header_rows()
+        for item in _generate_section("thead", header_rows):
+            yield item
         if len(self._body):
             yield self._body
-        body = TableBody()
-        body.extend(self.generate_rows())
-        if len(body):
-            yield body
-        for child in self.children:
-            yield child
+        for item in _generate_section("tbody", self.generate_rows()):
+            yield item
+        yield self.children
 
     def generate_header_rows(self):
         """Return an iterator over rows of this table's head.
 
-        This method can be overridden by sub-classes.
+        This method can be overridden by sub-classes. Rows are generated
+        as they are returned from the iterator, so the iterator can
+        produce rows lazily, for example from a database cursor.
 
         """
         if False:
@@ -197,14 +306,51 @@ class Table(Element):
     def generate_rows(self):
         """Return an iterator over rows of this table's body.
 
-        This method can be overridden by sub-classes.
+        This method can be overridden by sub-classes. Rows are generated
+        as they are returned from the iterator, so the iterator can
+        produce rows lazily, for example from a database cursor:
+
+            >>> class SquareTable(Table):
+            ...     def generate_rows(self):
+            ...         for i in range(1, 4):
+            ...             row = TableRow()
+            ...             cells = row.create_cells(str(i), str(i * i))
+            ...             yield row
+            >>> chunks = iter(SquareTable())
+            >>> next(chunks), next(chunks), next(chunks)
+            (b'<table>', b'<tbody>', b'<tr>')
 
         """
         if False:
             yield
 
 
+def _generate_section(element_name, rows):
+    # Only the first row is fetched before the section is opened, so that
+    # no section is generated for an empty iterator. All other rows are
+    # generated as they are produced, without collecting them first.
+    rows = iter(rows)
+    for first_row in rows:
+        break
+    else:
+        return
+    yield "<" + element_name + ">"
+    yield _escape_row(first_row)
+    for row in rows:
+        yield _escape_row(row)
+    yield "</" + element_name + ">"
+
+
+def _escape_row(row):
+    # Strings are escaped, like strings appended to a table section.
+    if hasattr(row, "generate"):
+        return row
+    return escape_text(row)
+
+
 class _TableSection(Element):
+    __slots__ = ()
+
     def create_row(self):
         """Create a TableRow, append it to this section, and return it."""
         row = TableRow()
@@ -224,6 +370,8 @@ class TableHead(_TableSection):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(TableHead, self).__init__("thead")
 
@@ -240,10 +388,459 @@ class TableBody(_TableSection):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(TableBody, self).__init__("tbody")
 
 
+class ColumnarTableBody(NonVoidElement):
+
+    """An HTML table body (<tbody>) element, rendered from columns.
+
+    The data is supplied as a list of columns. Each column is a sequence
+    with one value per row. Rows and cells are rendered directly from the
+    columns, without creating an element object per row or cell:
+
+        >>> body = ColumnarTableBody([["Apple", "Pear"], [1.5, 2]])
+        >>> str(body)
+        '<tbody><tr><td>Apple</td><td>1.5</td></tr><tr><td>Pear</td><td>2</td></tr></tbody>'
+
+    Strings are escaped. Generators are rendered in place. All other values
+    are converted using str() and escaped. All columns must have the same
+    length. The sequences are not copied, so changes to them are reflected
+    when the body is rendered.
+
+    Optionally, a formatter can be supplied per column. Formatters are
+    called with a slice of ROWS_PER_BATCH values of a column and must
+    return a list of HTML-escaped strings, one per value. Otherwise, a
+    ValueError is raised while rendering. htmlgen.formatting provides
+    formatters for strings, numbers, and dates, which process the whole
+    slice at once and are considerably faster than formatting each cell
+    separately:
+
+        >>> from functools import partial
+        >>> from htmlgen.formatting import format_decimals, format_strings
+        >>> format_price = partial(format_decimals, decimals=1)
+        >>> body = ColumnarTableBody(
+        ...     [["Apple", "Pear"], [1.5, 2]],
+        ...     formatters=[format_strings, format_price],
+        ... )
+        >>> str(body)
+        '<tbody><tr><td>Apple</td><td>1.5</td></tr><tr><td>Pear</td><td>2.0</td></tr></tbody>'
+
+    None can be used for columns without a formatter.
+
+    """
+
+    __slots__ = ("_columns", "_formatters")
+
+    def __init__(self, columns, formatters=None):
+        super(ColumnarTableBody, self).__init__("tbody")
+        if len(set(len(column) for column in columns)) > 1:
+            raise ValueError("all columns must have the same length")
+        if formatters is None:
+            formatters = [None] * len(columns)
+        elif len(formatters) != len(columns):
+            raise ValueError("one formatter per column is required")
+        self._columns = columns
+        self._formatters = list(formatters)
+
+    @property
+    def columns(self):
+        """Return a copy of the list of columns."""
+        return list(self._columns)
+
+    @property
+    def row_count(self):
+        """Return the number of rows."""
+        return len(self._columns[0]) if self._columns else 0
+
+    def generate_children(self):
+        # Rows are rendered in batches, see _generate_batch().
+        for start in range(0, self.row_count, ROWS_PER_BATCH):
+            stop = start + ROWS_PER_BATCH
+            columns = [column[start:stop] for column in self._columns]
+            for item in _generate_batch(columns, self._formatters):
+                yield item
+
+
+class TableWindow(NonVoidElement):
+
+    """An HTML table body (<tbody>) element showing some rows of a table.
+
+    rows is a sequence of rows, where each row is a sequence of values.
+    Only rows[start:stop] are rendered:
+
+        >>> rows = [("Apple", 1), ("Pear", 2), ("Plum", 3)]
+        >>> str(TableWindow(rows, 1, 3))
+        '<tbody><tr><td>Pear</td><td>2</td></tr><tr><td>Plum</td><td>3</td></tr></tbody>'
+
+    start must not be negative, and stop must not be less than start.
+    Negative indexes are not supported, since they would refer to the end
+    of the table.
+
+    rows is only accessed using slices of at most ROWS_PER_BATCH rows, so
+    it can be any object that supports slicing, for example an object that
+    fetches rows from a database on demand.
+
+    Values are rendered like the values of a ColumnarTableBody, and
+    formatters work the same way. All rows must have the same number of
+    values, and there must be one formatter per value. Otherwise, a
+    ValueError is raised while rendering.
+
+    """
+
+    __slots__ = ("_rows", "_start", "_stop", "_formatters")
+
+    def __init__(self, rows, start, stop, formatters=None):
+        super(TableWindow, self).__init__("tbody")
+        if start < 0:
+            raise ValueError("start must not be negative")
+        if stop < start:
+            raise ValueError("stop must not be less than start")
+        self._rows = rows
+        self._start = start
+        self._stop = stop
+        self._formatters = formatters
+
+    def generate_children(self):
+        width = None
+        formatters = None
+        for start in range(self._start, self._stop, ROWS_PER_BATCH):
+            stop = min(start + ROWS_PER_BATCH, self._stop)
+            rows = self._rows[start:stop]
+            if not rows:
+                break
+            if width is None:
+                width = len(rows[0])
+                formatters = _check_formatters(self._formatters, width)
+            columns = _columns_from_rows(rows, width)
+            for item in _generate_batch(columns, formatters):
+                yield item
+
+
+class TablePager(object):
+
+    """Render pages of a large table, caching each rendered page.
+
+    rows is a sequence of rows, see TableWindow for details. page() returns
+    a generator that renders the rows of one page as a <tbody> element:
+
+        >>> from htmlgen import FragmentCache
+        >>> rows = [("Apple", 1), ("Pear", 2), ("Plum", 3)]
+        >>> cache = FragmentCache()
+        >>> pager = TablePager("fruit", rows, page_size=2, cache=cache)
+        >>> pager.page_count
+        2
+        >>> table = Table()
+        >>> table.append(pager.page(1))
+        >>> str(table)
+        '<table><tbody><tr><td>Plum</td><td>3</td></tr></tbody></table>'
+
+    Rendered pages are stored in a FragmentCache - by default the
+    process-wide fragment_cache - under the key (key, version, page_size,
+    page number). Each page is only rendered once, until the version is
+    changed. key must be unique per cache. Change the version whenever
+    the rows change:
+
+        >>> rows[2] = ("Cherry", 4)
+        >>> pager.version += 1
+
+    formatters work like the formatters of a ColumnarTableBody. If rows is
+    not empty, the number of formatters is checked against the first row.
+
+    """
+
+    def __init__(
+        self,
+        key,
+        rows,
+        page_size=100,
+        formatters=None,
+        version=0,
+        cache=None,
+    ):
+        if page_size < 1:
+            raise ValueError("page size must be at least 1")
+        self.key = key
+        self.version = version
+        self.page_size = page_size
+        if formatters is not None and len(rows) > 0:
+            _check_formatters(formatters, len(rows[0:1][0]))
+        self._rows = rows
+        self._formatters = formatters
+        self._cache = cache if cache is not None else fragment_cache
+
+    @property
+    def page_count(self):
+        """Return the number of pages.
+
+        A table without rows has a single, empty page.
+
+        """
+        row_count = len(self._rows)
+        return max(1, (row_count + self.page_size - 1) // self.page_size)
+
+    def page(self, number):
+        """Return a generator for the page with the given number.
+
+        Pages are numbered starting at 0. If the page does not exist,
+        raise an IndexError.
+
+        """
+        if number < 0 or number >= self.page_count:
+            raise IndexError("page {} does not exist".format(number))
+        start = number * self.page_size
+        stop = min(start + self.page_size, len(self._rows))
+        window = partial(
+            TableWindow, self._rows, start, stop, self._formatters
+        )
+        key = (self.key, self.version, self.page_size, number)
+        return CachedFragment(key, window, cache=self._cache)
+
+
+class AsyncTableBody(NonVoidElement):
+
+    """An HTML table body (<tbody>) element, rendered from an asynchronous
+    iterator over rows.
+
+    Rows are fetched in batches of batch_size rows. While a batch is
+    rendered and sent, the next batch is already fetched in the
+    background. This is useful for rows read from an asynchronous database
+    driver:
+
+        >>> import asyncio
+        >>> class Rows:
+        ...     def __init__(self, rows):
+        ...         self._rows = iter(rows)
+        ...     def __aiter__(self):
+        ...         return self
+        ...     async def __anext__(self):
+        ...         for row in self._rows:
+        ...             return row
+        ...         raise StopAsyncIteration()
+        >>> body = AsyncTableBody(Rows([("Apple", 1.5), ("Pear", 2)]))
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(body.arender())
+        '<tbody><tr><td>Apple</td><td>1.5</td></tr><tr><td>Pear</td><td>2</td></tr></tbody>'
+        >>> loop.close()
+
+    Rows can be sequences of values or mappings. The values of mappings
+    are looked up using the keys in columns. If columns is None, the keys
+    of the first row are used. Values are rendered like the values of a
+    ColumnarTableBody, and formatters work the same way.
+
+    There must be one value per column in each sequence, a value for each
+    column in each mapping, and one formatter per column. If columns is
+    None, the columns are taken from the first row. Otherwise, a
+    ValueError is raised while rendering.
+
+    Like other table body elements, and unlike the rows returned by
+    Table.generate_rows(), an AsyncTableBody without rows is rendered as
+    an empty <tbody> element.
+
+    The rows can only be iterated once. Therefore, an AsyncTableBody can
+    only be rendered once, and only asynchronously, for example using
+    arender() or aiter_text(). If rendering stops early, the fetching of
+    the next batch is cancelled by AsyncFlattener.aclose().
+
+    """
+
+    __slots__ = ("_rows", "_columns", "_formatters", "_batch_size")
+
+    def __init__(
+        self, rows, columns=None, formatters=None, batch_size=ROWS_PER_BATCH
+    ):
+        super(AsyncTableBody, self).__init__("tbody")
+        if batch_size < 1:
+            raise ValueError("batch size must be at least 1")
+        if columns is not None:
+            columns = list(columns)
+            if formatters is not None:
+                _check_formatters(formatters, len(columns))
+        self._rows = rows
+        self._columns = columns
+        self._formatters = formatters
+        self._batch_size = batch_size
+
+    def generate(self):
+        raise TypeError("AsyncTableBody can only be rendered asynchronously")
+
+    def agenerate(self):
+        return _AsyncRowIterator(self)
+
+
+class _AsyncRowIterator(object):
+    def __init__(self, body):
+        self._body = body
+        self._rows = body._rows.__aiter__()
+        self._columns = body._columns
+        self._width = None
+        self._formatters = None
+        self._items = iter([body.render_start_tag() + ">"])
+        self._fetch = None
+        self._exhausted = False
+        self._finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            for item in self._items:
+                return item
+            if self._finished:
+                raise StopAsyncIteration()
+            rows = await self._next_batch()
+            if rows:
+                self._items = self._generate_rows(rows)
+            else:
+                self._items = iter(["</tbody>"])
+                self._finished = True
+
+    async def aclose(self):
+        # Called by AsyncFlattener when rendering stops early or fails.
+        fetch = self._fetch
+        self._fetch = None
+        self._exhausted = True
+        self._finished = True
+        self._items = iter([])
+        if fetch is None:
+            return
+        if not fetch.done():
+            fetch.cancel()
+        elif not fetch.cancelled():
+            # Retrieve the exception, so that it is not logged.
+            fetch.exception()
+
+    async def _next_batch(self):
+        if self._exhausted:
+            return []
+        if self._fetch is None:
+            rows = await self._fetch_batch()
+        else:
+            rows = await self._fetch
+            self._fetch = None
+        if len(rows) < self._body._batch_size:
+            self._exhausted = True
+        else:
+            # The next batch is fetched while this batch is rendered.
+            self._fetch = asyncio.ensure_future(self._fetch_batch())
+        return rows
+
+    async def _fetch_batch(self):
+        rows = []
+        while len(rows) < self._body._batch_size:
+            try:
+                row = await self._rows.__anext__()
+            except StopAsyncIteration:
+                break
+            rows.append(row)
+        return rows
+
+    def _generate_rows(self, rows):
+        is_mapping = isinstance(rows[0], Mapping)
+        if self._width is None:
+            if self._columns is None and is_mapping:
+                self._columns = list(rows[0])
+            if self._columns is not None:
+                self._width = len(self._columns)
+            else:
+                self._width = len(rows[0])
+            self._formatters = _check_formatters(
+                self._body._formatters, self._width
+            )
+        if is_mapping:
+            try:
+                columns = [
+                    [row[name] for row in rows] for name in self._columns
+                ]
+            except KeyError as exc:
+                raise ValueError("row has no column {!r}".format(exc.args[0]))
+        else:
+            columns = _columns_from_rows(rows, self._width)
+        return _generate_batch(columns, self._formatters)
+
+
+def _check_formatters(formatters, width):
+    if formatters is None:
+        return [None] * width
+    if len(formatters) != width:
+        raise ValueError("one formatter per column is required")
+    return formatters
+
+
+def _columns_from_rows(rows, width):
+    # zip() would silently truncate rows to the length of the shortest row.
+    for row in rows:
+        if len(row) != width:
+            raise ValueError("all rows must have the same number of values")
+    return list(zip(*rows))
+
+
+def _generate_batch(columns, formatters):
+    # Each column of a batch is formatted at once, then the rows of a
+    # batch are generated as a single string, unless they contain
+    # sub-generators.
+    cells = []
+    has_generators = False
+    for values, formatter in zip(columns, formatters):
+        if formatter is not None:
+            column_cells = formatter(values)
+            if len(column_cells) != len(values):
+                raise ValueError(
+                    "formatter returned {} values for {} rows".format(
+                        len(column_cells), len(values)
+                    )
+                )
+            cells.append(column_cells)
+        else:
+            column_cells = _format_cells(values)
+            cells.append(column_cells)
+            if not has_generators:
+                has_generators = any(
+                    type(cell) is not str for cell in column_cells
+                )
+    if has_generators:
+        for item in _generate_mixed_rows(cells):
+            yield item
+    else:
+        yield "".join(
+            [
+                "<tr><td>" + "</td><td>".join(row) + "</td></tr>"
+                for row in zip(*cells)
+            ]
+        )
+
+
+def _format_cells(values):
+    cells = []
+    for value in values:
+        if type(value) is str:
+            cells.append(escape_text(value))
+        elif hasattr(value, "generate"):
+            cells.append(value)
+        else:
+            cells.append(escape_text(str(value)))
+    return cells
+
+
+def _generate_mixed_rows(cells):
+    for row in zip(*cells):
+        parts = ["<tr>"]
+        for cell in row:
+            if type(cell) is str:
+                parts.append("<td>" + cell + "</td>")
+            else:
+                parts.append("<td>")
+                yield "".join(parts)
+                yield cell
+                parts = ["</td>"]
+        parts.append("</tr>")
+        yield "".join(parts)
+
+
 class TableRow(Element):
 
     """An HTML table row (<tr>) element.
@@ -257,6 +854,8 @@ class TableRow(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(TableRow, self).__init__("tr")
 
@@ -306,7 +905,136 @@ class TableRow(Element):
         return [self.create_header_cell(cell) for cell in content]
 
 
+class RowTemplate(object):
+
+    """A compiled table row with placeholders for cell values.
+
+    The prototype - usually a TableRow - is rendered once, when the
+    template is created. Slot objects in the prototype mark places where
+    values are filled in later:
+
+        >>> from htmlgen import Slot
+        >>> prototype = TableRow()
+        >>> name_cell = prototype.create_cell(Slot("name"))
+        >>> name_cell.add_css_classes("name")
+        >>> price_cell = prototype.create_cell(Slot("price"))
+        >>> price_cell.columns = 2
+        >>> template = RowTemplate(prototype)
+        >>> template.columns
+        ['name', 'price']
+        >>> template.render_row(("Apple & Pear", 1.5))
+        '<tr><td class="name">Apple &amp; Pear</td><td colspan="2">1.5</td></tr>'
+
+    Rows are sequences of values in the order given by columns, or
+    mappings from slot names to values. By default, the columns are the
+    slot names in the order of their first occurrence in the prototype.
+    Values are rendered like the values of a ColumnarTableBody.
+
+    fill_rows() returns a generator that renders many rows, and that can
+    be appended to a table or table section:
+
+        >>> rows = [("Plum", 3), {"name": "Fig", "price": 4}]
+        >>> table = Table()
+        >>> body = table.create_body()
+        >>> body.append(template.fill_rows(rows))
+        >>> str(table)
+        '<table><tbody><tr><td class="name">Plum</td><td colspan="2">3</td></tr><tr><td class="name">Fig</td><td colspan="2">4</td></tr></tbody></table>'
+
+    Since the prototype is not rendered again, filling a row template is
+    much faster than creating and rendering a TableRow per row. Changes to
+    the prototype after the template was compiled have no effect.
+
+    """
+
+    def __init__(self, prototype, columns=None):
+        statics, slot_names = split_at_slots(prototype, text=True)
+        if columns is None:
+            columns = []
+            for name in slot_names:
+                if name not in columns:
+                    columns.append(name)
+        else:
+            columns = list(columns)
+            if len(set(columns)) != len(columns):
+                raise ValueError("duplicate columns")
+            if set(columns) != set(slot_names):
+                raise ValueError("columns must match the slot names")
+        self._columns = columns
+        self._statics = statics
+        self._indexes = [columns.index(name) for name in slot_names]
+        format_parts = [_escape_braces(statics[0])]
+        for index, static in zip(self._indexes, statics[1:]):
+            format_parts.append("{" + str(index) + "}")
+            format_parts.append(_escape_braces(static))
+        self._format = "".join(format_parts).format
+
+    @property
+    def columns(self):
+        """Return the list of column names."""
+        return list(self._columns)
+
+    def render_row(self, row):
+        """Render a single row and return HTML as a string."""
+        return "".join(self.fill_rows([row]).iter_text())
+
+    def fill_rows(self, rows):
+        """Return a generator that renders the given rows.
+
+        rows can be any iterable. It is consumed lazily, while the
+        generator is rendered. Rows are rendered in batches of
+        ROWS_PER_BATCH rows, which are generated as single strings.
+
+        """
+        return _FilledRows(self, rows)
+
+    def _generate_rows(self, rows):
+        format_ = self._format
+        column_count = len(self._columns)
+        batch = []
+        for row in rows:
+            if type(row) is not tuple and isinstance(row, Mapping):
+                row = [row[name] for name in self._columns]
+            elif len(row) != column_count:
+                raise ValueError(
+                    "expected {} values, got {}".format(column_count, len(row))
+                )
+            cells = _format_cells(row)
+            if all(type(cell) is str for cell in cells):
+                batch.append(format_(*cells))
+                if len(batch) == ROWS_PER_BATCH:
+                    yield "".join(batch)
+                    batch = []
+                continue
+            if batch:
+                yield "".join(batch)
+                batch = []
+            yield self._statics[0]
+            for index, static in zip(self._indexes, self._statics[1:]):
+                yield cells[index]
+                yield static
+        if batch:
+            yield "".join(batch)
+
+
+class _FilledRows(Generator):
+    __slots__ = ("_template", "_rows")
+
+    def __init__(self, template, rows):
+        super(_FilledRows, self).__init__()
+        self._template = template
+        self._rows = rows
+
+    def generate(self):
+        return self._template._generate_rows(self._rows)
+
+
+def _escape_braces(s):
+    return s.replace("{", "{{").replace("}", "}}")
+
+
 class _TableCellBase(Element):
+    __slots__ = ()
+
     def __init__(self, element_name, *content):
         super(_TableCellBase, self).__init__(element_name)
         self.extend(content)
@@ -327,6 +1055,8 @@ class TableHeaderCell(_TableCellBase):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(TableHeaderCell, self).__init__("th", *content)
 
@@ -343,6 +1073,8 @@ class TableCell(_TableCellBase):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *content):
         super(TableCell, self).__init__("td", *content)
 
@@ -357,6 +1089,8 @@ class ColumnGroup(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(ColumnGroup, self).__init__("colgroup")
 
@@ -381,5 +1115,7 @@ class Column(Element):
 
     """An HTML column (<col>) element."""
 
+    __slots__ = ()
+
     def __init__(self):
         super(Column, self).__init__("col")
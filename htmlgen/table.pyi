@@ -1,9 +1,28 @@
 import typing
-from typing import Union, List
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from htmlgen.element import Element
+from htmlgen.cache import CachedFragment, FragmentCache
+from htmlgen.element import Element, NonVoidElement
 from htmlgen.generator import Generator
 
+_TT = TypeVar("_TT", bound=Table)
+_Formatter = Callable[[Sequence[Any]], List[str]]
+
+ROWS_PER_BATCH: int
+
 class Table(Element):
     def __init__(self) -> None: ...
     def create_head(self) -> TableHead: ...
@@ -18,6 +37,20 @@ class Table(Element):
     def create_simple_row(
         self, *cells: Union[str, bytes, Generator]
     ) -> TableRow: ...
+    @classmethod
+    def from_columns(
+        cls: Type[_TT],
+        columns: Mapping[str, Sequence[Any]],
+        formatters: Optional[Mapping[str, _Formatter]] = ...,
+    ) -> _TT: ...
+    @classmethod
+    def from_async_rows(
+        cls: Type[_TT],
+        rows: AsyncIterable[Any],
+        columns: Optional[Iterable[str]] = ...,
+        formatters: Optional[Mapping[str, _Formatter]] = ...,
+        batch_size: int = ...,
+    ) -> _TT: ...
     def generate_header_rows(
         self
     ) -> typing.Generator[TableRow, None, None]: ...
@@ -31,6 +64,52 @@ class TableBody(Element):
     def __init__(self) -> None: ...
     def create_row(self) -> TableRow: ...
 
+class ColumnarTableBody(NonVoidElement):
+    def __init__(
+        self,
+        columns: Sequence[Sequence[Any]],
+        formatters: Optional[Sequence[Optional[_Formatter]]] = ...,
+    ) -> None: ...
+    @property
+    def columns(self) -> List[Sequence[Any]]: ...
+    @property
+    def row_count(self) -> int: ...
+
+class TableWindow(NonVoidElement):
+    def __init__(
+        self,
+        rows: Sequence[Sequence[Any]],
+        start: int,
+        stop: int,
+        formatters: Optional[Sequence[Optional[_Formatter]]] = ...,
+    ) -> None: ...
+
+class TablePager:
+    key: Hashable
+    version: Any
+    page_size: int
+    def __init__(
+        self,
+        key: Hashable,
+        rows: Sequence[Sequence[Any]],
+        page_size: int = ...,
+        formatters: Optional[Sequence[Optional[_Formatter]]] = ...,
+        version: Any = ...,
+        cache: Optional[FragmentCache] = ...,
+    ) -> None: ...
+    @property
+    def page_count(self) -> int: ...
+    def page(self, number: int) -> CachedFragment: ...
+
+class AsyncTableBody(NonVoidElement):
+    def __init__(
+        self,
+        rows: AsyncIterable[Any],
+        columns: Optional[Iterable[Hashable]] = ...,
+        formatters: Optional[Sequence[Optional[_Formatter]]] = ...,
+        batch_size: int = ...,
+    ) -> None: ...
+
 class TableRow(Element):
     def __init__(self) -> None: ...
     def create_cell(
@@ -46,6 +125,19 @@ class TableRow(Element):
         self, *content: Union[str, bytes, Generator]
     ) -> List[TableHeaderCell]: ...
 
+class RowTemplate(object):
+    def __init__(
+        self, prototype: Generator, columns: Optional[Iterable[str]] = ...
+    ) -> None: ...
+    @property
+    def columns(self) -> List[str]: ...
+    def render_row(
+        self, row: Union[Sequence[Any], Mapping[str, Any]]
+    ) -> str: ...
+    def fill_rows(
+        self, rows: Iterable[Union[Sequence[Any], Mapping[str, Any]]]
+    ) -> Generator: ...
+
 class TableHeaderCell(Element):
     rows: int
     columns: int
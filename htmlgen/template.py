@@ -0,0 +1,154 @@
+from htmlgen.escaping import escape_text
+from htmlgen.generator import Generator
+
+
+class Slot(Generator):
+
+    """A named placeholder in a template.
+
+    See Template for details. Slots can only be rendered as part of a
+    template.
+
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        super(Slot, self).__init__()
+        self.name = name
+
+    def generate(self):
+        raise ValueError(
+            "slot '{}' can only be rendered by a template".format(self.name)
+        )
+
+
+def split_at_slots(generator, text=False):
+    """Render a generator tree and split the result at its slots.
+
+        >>> from htmlgen import Division
+        >>> split_at_slots(Division("A", Slot("x"), "B", Slot("y")))
+        ([b'<div>A', b'B', b'</div>'], ['x', 'y'])
+
+    Return a tuple of a list of the rendered static parts and a list of
+    slot names. There is one more static part than there are slots. The
+    parts are UTF-8 encoded byte strings or, if text is True, str
+    objects.
+
+    """
+    empty = "" if text else b""
+    statics = []
+    slot_names = []
+    fragments = []
+    for item in generator.iter_with_markers(text, [Slot]):
+        if isinstance(item, Slot):
+            statics.append(empty.join(fragments))
+            slot_names.append(item.name)
+            fragments = []
+        else:
+            fragments.append(item)
+    statics.append(empty.join(fragments))
+    return statics, slot_names
+
+
+class Template(object):
+
+    """A compiled, pre-rendered generator tree with named slots.
+
+    The generator is rendered once, when the template is created. Slot
+    objects in the tree mark places where values are filled in later:
+
+        >>> from htmlgen import Division, Span
+        >>> template = Template(
+        ...     Division("Hello ", Span(Slot("name")), Slot("greeting"))
+        ... )
+        >>> template.render(name="<World>", greeting="!")
+        b'<div>Hello <span>&lt;World&gt;</span>!</div>'
+
+    Values can be strings, which are HTML-escaped, or generators, which
+    are rendered in place:
+
+        >>> template.render(name=Span("Bob"), greeting="")
+        b'<div>Hello <span><span>Bob</span></span></div>'
+
+    A slot can occur multiple times in a template. All slots must be
+    filled when rendering. Slots can not be used as attribute values.
+
+    Since the static parts of the tree are not rendered again, render()
+    is much faster than constructing and rendering the tree for every
+    page. Changes to the tree after the template was compiled have no
+    effect.
+
+    """
+
+    def __init__(self, generator):
+        statics, slot_names = split_at_slots(generator)
+        self._first_static = statics[0]
+        self._parts = list(zip(slot_names, statics[1:]))
+        self._slot_names = frozenset(slot_names)
+
+    @property
+    def slot_names(self):
+        """Return the set of slot names in this template."""
+        return set(self._slot_names)
+
+    def render(self, **values):
+        """Render the template and return UTF-8 encoded HTML."""
+        self._check_values(values)
+        pieces = [self._first_static]
+        for name, static in self._parts:
+            value = values[name]
+            if isinstance(value, str):
+                pieces.append(escape_text(value).encode("utf-8"))
+            else:
+                pieces.extend(value)
+            pieces.append(static)
+        return b"".join(pieces)
+
+    def render_text(self, **values):
+        """Render the template and return HTML as a string."""
+        return self.render(**values).decode("utf-8")
+
+    def fill(self, **values):
+        """Return a generator that renders the template.
+
+        This can be used to include a template into a generator tree.
+
+            >>> from htmlgen import Division
+            >>> template = Template(Division(Slot("content")))
+            >>> str(Division("Foo", template.fill(content="Bar")))
+            '<div>Foo<div>Bar</div></div>'
+
+        """
+        self._check_values(values)
+        return _FilledTemplate(self._first_static, self._parts, values)
+
+    def _check_values(self, values):
+        if values.keys() != self._slot_names:
+            missing = sorted(self._slot_names - set(values))
+            if missing:
+                raise TypeError("missing slot values: " + ", ".join(missing))
+            unknown = sorted(set(values) - self._slot_names)
+            raise TypeError("unknown slots: " + ", ".join(unknown))
+        for name, value in values.items():
+            if not isinstance(value, str) and not hasattr(value, "generate"):
+                raise TypeError(
+                    "can not fill slot '{}' with {}".format(name, repr(value))
+                )
+
+
+class _FilledTemplate(Generator):
+    __slots__ = ("_first_static", "_parts", "_values")
+
+    def __init__(self, first_static, parts, values):
+        super(_FilledTemplate, self).__init__()
+        self._first_static = first_static
+        self._parts = parts
+        self._values = values
+
+    def generate(self):
+        yield self._first_static
+        for name, static in self._parts:
+            value = self._values[name]
+            yield escape_text(value) if isinstance(value, str) else value
+            yield static
@@ -0,0 +1,19 @@
+from typing import Any, List, Set, Tuple, Union
+
+from htmlgen.generator import Generator
+
+class Slot(Generator):
+    name: str
+    def __init__(self, name: str) -> None: ...
+
+def split_at_slots(
+    generator: Generator, text: bool = ...
+) -> Tuple[List[Any], List[str]]: ...
+
+class Template(object):
+    def __init__(self, generator: Generator) -> None: ...
+    @property
+    def slot_names(self) -> Set[str]: ...
+    def render(self, **values: Union[str, Generator]) -> bytes: ...
+    def render_text(self, **values: Union[str, Generator]) -> str: ...
+    def fill(self, **values: Union[str, Generator]) -> Generator: ...
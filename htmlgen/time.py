@@ -9,7 +9,7 @@ class Time(Element):
     >>> time1 = Time(date(2014, 12, 31))
     >>> time1.append("new year's eve")
     >>> str(time1)
-    '<time datetime="2014-12-31">new year&#x27;s eve</time>'
+    '<time datetime="2014-12-31">new year\\'s eve</time>'
     >>> time2 = Time(datetime(2014, 5, 17, 13, 15, 0))
     >>> time2.append("May 17th, quarter past one")
     >>> str(time2)
@@ -17,6 +17,8 @@ class Time(Element):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, date):
         super(Time, self).__init__("time")
         if hasattr(date, "hour"):
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import gc
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from asserts import (
+    assert_equal,
+    assert_raises,
+    assert_greater,
+    assert_true,
+)
+
+import htmlgen.asynchronous
+from htmlgen.asynchronous import FRAGMENTS_PER_YIELD, AsyncFlattener
+from htmlgen.element import Element, NonVoidElement
+from htmlgen.generator import (
+    Generator,
+    ChildGenerator,
+    HTMLJoinGenerator,
+    JoinGenerator,
+)
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def _collect(iterator):
+    items = []
+    async for item in iterator:
+        items.append(item)
+    return items
+
+
+class _AsyncIterator(object):
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration()
+
+
+class _AsyncGenerator(Generator):
+    def __init__(self, items):
+        self._items = items
+
+    def generate(self):
+        return _AsyncIterator(self._items)
+
+
+class _SyncGenerator(Generator):
+    def __init__(self, items):
+        self._items = items
+
+    def generate(self):
+        return iter(self._items)
+
+
+async def _value(value):
+    await asyncio.sleep(0)
+    return value
+
+
+class AsyncFlattenerTest(TestCase):
+    def test_sync_generator(self):
+        inner = _SyncGenerator([u"bär"])
+        generator = _SyncGenerator([u"foo", inner, b"baz"])
+        assert_equal([b"foob\xc3\xa4rbaz"], _run(_collect(generator)))
+
+    def test_batch_size(self):
+        generator = _SyncGenerator([u"x"] * (FRAGMENTS_PER_YIELD * 2 + 1))
+        batches = _run(_collect(generator.aiter_text()))
+        assert_equal(
+            [FRAGMENTS_PER_YIELD, FRAGMENTS_PER_YIELD, 1],
+            [len(batch) for batch in batches],
+        )
+
+    def test_async_generator(self):
+        inner = _AsyncGenerator([u"bär"])
+        generator = _AsyncGenerator([u"foo", inner, b"baz"])
+        assert_equal(
+            [b"foo", b"b\xc3\xa4r", b"baz"], _run(_collect(generator))
+        )
+
+    def test_mixed_generators(self):
+        inner = _SyncGenerator([u"bar", _AsyncGenerator([u"baz"])])
+        generator = _AsyncGenerator([u"foo", inner])
+        assert_equal([b"foo", b"bar", b"baz"], _run(_collect(generator)))
+
+    def test_async_child_of_element(self):
+        element = Element("div")
+        element.append(_AsyncGenerator([u"<foo>"]))
+        assert_equal(
+            [b"<div>", b"<foo>", b"</div>"], _run(_collect(element))
+        )
+
+    def test_awaitable_items(self):
+        inner = _SyncGenerator([_value(u"bar")])
+        generator = _SyncGenerator([_value(u"foo"), _value(inner)])
+        assert_equal([b"foo", b"bar"], _run(_collect(generator)))
+
+    def test_awaitable_generate(self):
+        class AwaitingGenerator(Generator):
+            def generate(self):
+                return _value(u"foo")
+
+        assert_equal([b"foo"], _run(_collect(AwaitingGenerator())))
+
+    def test_agenerate(self):
+        class DualGenerator(Generator):
+            def generate(self):
+                return iter([u"sync"])
+
+            def agenerate(self):
+                return _AsyncIterator([u"async"])
+
+        generator = DualGenerator()
+        assert_equal([b"sync"], list(iter(generator)))
+        assert_equal([b"async"], _run(_collect(generator)))
+
+    def test_async_generate_children(self):
+        state = _widget_state()
+
+        class AsyncElement(NonVoidElement):
+            async def generate_children(self):  # type: ignore
+                await asyncio.sleep(0)
+                return [
+                    u"<foo>",
+                    _Widget("a", 3, state),
+                    _Widget("b", 3, state),
+                ]
+
+        element = AsyncElement("div")
+        assert_equal("<div><foo>ab</div>", _run(element.arender()))
+        assert_equal(2, state["max_active"])
+        with assert_raises(TypeError):
+            element.render()
+
+    def test_async_iterator_children(self):
+        class AsyncElement(NonVoidElement):
+            def generate_children(self):
+                return _AsyncIterator([u"foo", _SyncGenerator([u"bar"])])
+
+        element = AsyncElement("div")
+        assert_equal("<div>foobar</div>", _run(element.arender()))
+        with assert_raises(TypeError):
+            element.render()
+
+    def test_aiter_text(self):
+        generator = _AsyncGenerator([u"foo", b"b\xc3\xa4r"])
+        assert_equal(
+            [u"foo", u"bär"], _run(_collect(generator.aiter_text()))
+        )
+
+    def test_arender(self):
+        inner = _AsyncGenerator([u"bär"])
+        generator = ChildGenerator()
+        generator.extend([u"foo", inner, b"baz"])
+        assert_equal(u"foobärbaz", _run(generator.arender()))
+
+    def test_kind_cache_is_bounded(self):
+        for _ in range(htmlgen.asynchronous._CACHE_SIZE + 10):
+            item_type = type("Text", (str,), {})
+            generator = _SyncGenerator([item_type(u"x")])
+            assert_equal([b"x"], _run(_collect(generator)))
+        assert_true(
+            len(htmlgen.asynchronous._async_kinds)
+            <= htmlgen.asynchronous._CACHE_SIZE
+        )
+
+    def test_invalid_class(self):
+        generator = _AsyncGenerator([5])
+        with assert_raises(TypeError):
+            _run(generator.arender())
+
+    def test_yield_to_event_loop(self):
+        ticks = []  # type: List[None]
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def render():
+            task = asyncio.ensure_future(tick())
+            generator = _SyncGenerator([u"x"] * FRAGMENTS_PER_YIELD * 4)
+            await generator.arender()
+            task.cancel()
+
+        _run(render())
+        assert_greater(len(ticks), 2)
+
+
+class _Widget(Generator):
+    """Record how many widgets are rendered at the same time."""
+
+    def __init__(self, name, delay, state):
+        self._name = name
+        self._delay = delay
+        self._state = state
+
+    async def generate(self):  # type: ignore
+        self._state["active"] += 1
+        self._state["max_active"] = max(
+            self._state["max_active"], self._state["active"]
+        )
+        for _ in range(self._delay):
+            await asyncio.sleep(0)
+        self._state["active"] -= 1
+        self._state["done"] += 1
+        return self._name
+
+
+def _widget_state():
+    return {"active": 0, "max_active": 0, "done": 0}
+
+
+class ConcurrentChildrenTest(TestCase):
+    def test_render_concurrently_in_order(self):
+        state = _widget_state()
+        element = Element("div")
+        for i in range(4):
+            element.append(_Widget(str(i), 10 - i, state))
+        assert_equal("<div>0123</div>", _run(element.arender()))
+        assert_equal(4, state["max_active"])
+
+    def test_max_concurrency(self):
+        state = _widget_state()
+        element = Element("div")
+        for i in range(5):
+            element.append(_Widget(str(i), 5, state))
+        element.append("<end>")
+        result = _run(element.arender(max_concurrency=2))
+        assert_equal("<div>01234&lt;end&gt;</div>", result)
+        assert_equal(2, state["max_active"])
+
+    def test_wrapped_children(self):
+        state = _widget_state()
+        element = Element("div")
+        for i in range(4):
+            wrapper = Element("p")
+            wrapper.append(_Widget(str(i), 10 - i, state))
+            element.append(wrapper)
+        assert_equal(
+            "<div><p>0</p><p>1</p><p>2</p><p>3</p></div>",
+            _run(element.arender()),
+        )
+        assert_equal(4, state["max_active"])
+
+    def test_look_ahead_is_limited(self):
+        state = _widget_state()
+        generator = ChildGenerator()
+        generator.append(_Widget("a", 3, state))
+        generator.extend([u"x"] * FRAGMENTS_PER_YIELD)
+        generator.append(_Widget("b", 3, state))
+        result = _run(generator.arender())
+        assert_equal("a" + "x" * FRAGMENTS_PER_YIELD + "b", result)
+        assert_equal(1, state["max_active"])
+
+    def test_no_concurrency(self):
+        state = _widget_state()
+        generator = ChildGenerator()
+        generator.extend([_Widget("a", 3, state), _Widget("b", 3, state)])
+        assert_equal("ab", _run(generator.arender(max_concurrency=0)))
+        assert_equal(1, state["max_active"])
+
+    def test_nested(self):
+        state = _widget_state()
+        inner = Element("span")
+        inner.extend([_Widget("a", 3, state), _Widget("b", 3, state)])
+        outer = Element("div")
+        outer.extend([inner, _Widget("c", 3, state)])
+        assert_equal(
+            "<div><span>ab</span>c</div>",
+            _run(outer.arender(max_concurrency=1)),
+        )
+
+    def test_awaitable_children(self):
+        generator = ChildGenerator()
+        children = [_value(u"foo"), u"bar", _value(b"baz")]
+        generator.extend(children)  # type: ignore
+        assert_equal([b"foo", b"bar", b"baz"], _run(_collect(generator)))
+
+    def test_join_generator(self):
+        state = _widget_state()
+        generator = JoinGenerator(
+            ", ", [_Widget("a", 3, state), _Widget("b", 1, state)]
+        )
+        assert_equal("a, b", _run(generator.arender()))
+        assert_equal(2, state["max_active"])
+
+    def test_html_join_generator(self):
+        state = _widget_state()
+        generator = HTMLJoinGenerator(" & ", [_Widget("a", 1, state), "b"])
+        assert_equal("a &amp; b", _run(generator.arender()))
+
+    def test_error_cancels_siblings(self):
+        class FailingWidget(Generator):
+            async def generate(self):  # type: ignore
+                raise ValueError()
+
+        state = _widget_state()
+        generator = ChildGenerator()
+        generator.extend([FailingWidget(), _Widget("a", 10, state)])
+
+        async def render():
+            with assert_raises(ValueError):
+                await _collect(AsyncFlattener(generator))
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+        _run(render())
+        assert_equal(0, state["done"])
+
+    def test_aclose_cancels_siblings(self):
+        class FailingWidget(Generator):
+            async def generate(self):  # type: ignore
+                raise ValueError()
+
+        state = _widget_state()
+        element = Element("div")
+        element.extend(
+            [_Widget("a", 1, state), _Widget("b", 20, state), FailingWidget()]
+        )
+        errors = []  # type: List[Dict[str, Any]]
+
+        async def render():
+            asyncio.get_event_loop().set_exception_handler(
+                lambda _, context: errors.append(context)
+            )
+            flattener = AsyncFlattener(element, text=True)
+            async for fragment in flattener:
+                if fragment == "a":
+                    break
+            await flattener.aclose()
+            gc.collect()
+            for _ in range(30):
+                await asyncio.sleep(0)
+
+        _run(render())
+        assert_equal(1, state["done"])
+        assert_equal([], errors)
+
+    def test_aclose_closes_iterators(self):
+        closed = []
+
+        class ClosableIterator(_AsyncIterator):
+            async def aclose(self):
+                closed.append(True)
+
+        class ClosableGenerator(Generator):
+            def generate(self):
+                return ClosableIterator([u"foo", u"bar"])
+
+        async def render():
+            flattener = AsyncFlattener(ClosableGenerator(), text=True)
+            first = await flattener.__anext__()
+            await flattener.aclose()
+            rest = await _collect(flattener)
+            return first, rest
+
+        assert_equal((u"foo", []), _run(render()))
+        assert_equal([True], closed)
+
+    def test_aclose_twice(self):
+        async def render():
+            flattener = AsyncFlattener(_SyncGenerator([u"foo"]))
+            await flattener.aclose()
+            await flattener.aclose()
+            return await _collect(flattener)
+
+        assert_equal([], _run(render()))
@@ -0,0 +1,123 @@
+from typing import List
+from unittest import TestCase
+
+from asserts import assert_equal, assert_is_none, assert_raises, assert_true
+
+from htmlgen import ListItem, UnorderedList
+from htmlgen.cache import CachedFragment, FragmentCache, fragment_cache
+
+
+class FragmentCacheTest(TestCase):
+    def test_get_unknown(self):
+        cache = FragmentCache()
+        assert_is_none(cache.get("foo"))
+        assert_equal(0, cache.hits)
+        assert_equal(1, cache.misses)
+
+    def test_set_and_get(self):
+        cache = FragmentCache()
+        cache.set("foo", b"Foo")
+        cache.set(("bar", 1), b"Bar")
+        assert_equal(b"Foo", cache.get("foo"))
+        assert_equal(b"Bar", cache.get(("bar", 1)))
+        assert_equal(2, cache.hits)
+        assert_equal(0, cache.misses)
+        assert_equal(2, len(cache))
+        assert_equal(6, cache.size)
+        assert_true("foo" in cache)
+
+    def test_set_str(self):
+        cache = FragmentCache()
+        with assert_raises(TypeError):
+            cache.set("foo", "Foo")  # type: ignore
+
+    def test_replace(self):
+        cache = FragmentCache()
+        cache.set("foo", b"Foo")
+        cache.set("foo", b"Foobar")
+        assert_equal(b"Foobar", cache.get("foo"))
+        assert_equal(6, cache.size)
+
+    def test_evict_least_recently_used(self):
+        cache = FragmentCache(max_size=10)
+        cache.set("a", b"aaa")
+        cache.set("b", b"bbb")
+        cache.set("c", b"ccc")
+        cache.get("a")
+        cache.set("d", b"dddd")
+        assert_equal(b"aaa", cache.get("a"))
+        assert_is_none(cache.get("b"))
+        assert_equal(b"ccc", cache.get("c"))
+        assert_equal(b"dddd", cache.get("d"))
+        assert_equal(10, cache.size)
+
+    def test_do_not_cache_large_fragments(self):
+        cache = FragmentCache(max_size=3)
+        cache.set("a", b"aa")
+        cache.set("b", b"bbbb")
+        assert_equal(b"aa", cache.get("a"))
+        assert_is_none(cache.get("b"))
+
+    def test_render(self):
+        calls = []  # type: List[None]
+
+        def build():
+            calls.append(None)
+            return ListItem("Foo")
+
+        cache = FragmentCache()
+        assert_equal(b"<li>Foo</li>", cache.render("foo", build))
+        assert_equal(b"<li>Foo</li>", cache.render("foo", build))
+        assert_equal(1, len(calls))
+
+    def test_invalidate(self):
+        cache = FragmentCache()
+        cache.set("foo", b"Foo")
+        cache.invalidate("foo")
+        cache.invalidate("bar")
+        assert_is_none(cache.get("foo"))
+        assert_equal(0, cache.size)
+
+    def test_clear(self):
+        cache = FragmentCache()
+        cache.set("foo", b"Foo")
+        cache.get("foo")
+        cache.get("bar")
+        cache.clear()
+        assert_equal(0, len(cache))
+        assert_equal(0, cache.size)
+        assert_equal(0, cache.hits)
+        assert_equal(0, cache.misses)
+
+
+class CachedFragmentTest(TestCase):
+    def setUp(self):
+        fragment_cache.clear()
+
+    def tearDown(self):
+        fragment_cache.clear()
+
+    def test_generate(self):
+        calls = []  # type: List[None]
+
+        def build_menu():
+            calls.append(None)
+            menu = UnorderedList()
+            menu.create_items("Home", "<Products>")
+            return menu
+
+        menu = UnorderedList()
+        menu.create_items("Home", "<Products>")
+        expected = [b"<ul><li>Home</li><li>&lt;Products&gt;</li></ul>"]
+        assert_equal(expected, list(iter(CachedFragment("m", build_menu))))
+        assert_equal(expected, list(iter(CachedFragment("m", build_menu))))
+        assert_equal(1, len(calls))
+        assert_equal(1, fragment_cache.hits)
+        assert_equal(1, fragment_cache.misses)
+
+    def test_custom_cache(self):
+        cache = FragmentCache()
+        fragment = CachedFragment("foo", lambda: ListItem("Foo"), cache=cache)
+        assert_equal("<li>Foo</li>", str(fragment))
+        assert_equal(1, len(cache))
+        assert_equal(0, len(fragment_cache))
@@ -1,3 +1,4 @@
+import gc
 from typing import cast, List
 from unittest import TestCase
 
@@ -20,6 +21,7 @@ from htmlgen import (
     Script,
     HeadLink,
     Main,
+    Table,
 )
 from htmlgen.document import json_script
 
@@ -74,6 +76,27 @@ class DocumentTest(TestCase):
         assert_equal("en", doc.root.get_attribute("lang"))
         assert_equal("en", doc.root.get_attribute("xml:lang"))
 
+    def test_no_reference_cycles(self):
+        gc.collect()
+        gc.disable()
+        try:
+            doc = Document(title="Test Title")
+            doc.add_stylesheet("style.css")
+            doc.add_script("script.js")
+            table = Table()
+            table.add_css_classes("data")
+            row = table.create_row()
+            cell = row.create_cell("Foo")
+            cell.data["id"] = "1"
+            cell.set_style("color", "red")
+            doc.append_body(table)
+            str(doc)
+            list(iter(doc))
+            del doc, table, row, cell
+            assert_equal(0, gc.collect())
+        finally:
+            gc.enable()
+
     def test_stylesheets(self):
         head = _TestingHead()
         doc = Document()
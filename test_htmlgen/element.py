@@ -1,15 +1,20 @@
+import pickle
 import re
+import weakref
 from unittest import TestCase
 
 from asserts import (
     assert_false,
     assert_true,
     assert_equal,
+    assert_is,
     assert_is_none,
     assert_raises,
 )
 
+import htmlgen
 from htmlgen.element import Element, VoidElement, NonVoidElement
+from htmlgen.generator import Generator
 
 
 class NonVoidElementTest(TestCase):
@@ -41,6 +46,16 @@ class ElementTest(TestCase):
         element.extend_raw([", ", "World", "!"])
         assert_equal(8, len(element))
 
+    def test_remove(self):
+        element = Element("div")
+        element.extend(["<foo>", "bar"])
+        element.append_raw("<baz>")
+        element.remove("<foo>")
+        element.remove_raw("<baz>")
+        with assert_raises(ValueError):
+            element.remove_raw("<foo>")
+        assert_equal("<div>bar</div>", str(element))
+
     def test_empty(self):
         element = Element("div")
         element.append("foo")
@@ -60,6 +75,72 @@ class ElementTest(TestCase):
             list(iter(element)),
         )
 
+    def test_iter_text_with_children(self):
+        element = Element("div")
+        element.extend(["<foo>", "bär"])
+        assert_equal(
+            ["<div>", "&lt;foo&gt;", "bär", "</div>"],
+            list(element.iter_text()),
+        )
+
+    def test_freeze(self):
+        element = Element("div")
+        element.set_attribute("foo", "bar")
+        element.append("<Foo>")
+        frozen = element.freeze()
+        element.append("Bar")
+        assert_equal([b'<div foo="bar">&lt;Foo&gt;</div>'], list(iter(frozen)))
+
+    def test_escape_attribute_value(self):
+        element = Element("div")
+        element.set_attribute("title", "<Tom & \"Jerry's\">")
+        assert_equal(
+            '<div title="<Tom &amp; &quot;Jerry\'s&quot;>"></div>',
+            str(element),
+        )
+
+    def test_escape_text(self):
+        element = Element("div")
+        element.append("<Tom & \"Jerry's\">")
+        assert_equal(
+            "<div>&lt;Tom &amp; \"Jerry's\"&gt;</div>", str(element)
+        )
+
+    def test_pickle(self):
+        element = Element("div")
+        element.set_attribute("foo", "bar")
+        element.append("Foo")
+        copy = pickle.loads(pickle.dumps(element))
+        assert_equal('<div foo="bar">Foo</div>', str(copy))
+
+    def test_slots(self):
+        element = Element("div")
+        assert_false(hasattr(element, "__dict__"))
+        with assert_raises(AttributeError):
+            element.foo = "bar"
+
+    def test_sub_class_without_slots(self):
+        class MyElement(Element):
+            pass
+
+        element = MyElement("div")
+        element.foo = "bar"
+        assert_equal("bar", element.foo)
+
+    def test_weakref(self):
+        element = Element("div")
+        ref = weakref.ref(element)
+        assert_is(element, ref())
+
+    def test_all_generators_are_slotted(self):
+        for name, value in vars(htmlgen).items():
+            if isinstance(value, type) and issubclass(value, Generator):
+                for cls in value.__mro__[:-1]:
+                    assert_true(
+                        "__slots__" in vars(cls),
+                        "{} has no __slots__".format(cls.__name__),
+                    )
+
     def test_attributes(self):
         element = Element("div")
         element.set_attribute("foo", "bar")
@@ -81,6 +162,17 @@ class ElementTest(TestCase):
             [b'<div abc="" def="" ghi="">', b"</div>"], list(iter(element))
         )
 
+    def test_attribute_order__after_changes(self):
+        element = Element("div")
+        element.set_attribute("ghi", "")
+        element.set_attribute("abc", "")
+        element.set_attribute("def", "")
+        element.remove_attribute("abc")
+        element.set_attribute("ghi", "x")
+        element.set_attribute("abc", "y")
+        assert_equal('<div abc="y" def="" ghi="x"></div>', str(element))
+        assert_equal({"abc", "def", "ghi"}, element.attribute_names)
+
     def test_get_attribute(self):
         element = Element("div")
         assert_is_none(element.get_attribute("foo"))
@@ -94,6 +186,9 @@ class ElementTest(TestCase):
         assert_is_none(element.get_attribute("foo"))
         assert_equal([b"<div>", b"</div>"], list(iter(element)))
 
+    def test_attribute_names__no_attributes(self):
+        assert_equal(set(), Element("div").attribute_names)
+
     def test_attribute_names(self):
         element = Element("div")
         element.set_attribute("foo", "")
@@ -115,6 +210,13 @@ class ElementTest(TestCase):
         css_classes = matches.group(1).split(" ")
         assert_equal(["bar", "baz", "foo"], css_classes)
 
+    def test_css_class_order(self):
+        element = Element("div")
+        element.add_css_classes("foo", "bar", "foo")
+        element.add_css_classes("baz", "bar")
+        element.remove_css_classes("baz", "baz")
+        assert_equal('<div class="bar foo"></div>', str(element))
+
     def test_remove_css_classes(self):
         element = Element("div")
         element.add_css_classes("foo", "bar", "baz")
@@ -125,6 +227,13 @@ class ElementTest(TestCase):
         css_classes.sort()
         assert_equal(["baz", "foo"], css_classes)
 
+    def test_css_classes_without_classes(self):
+        element = Element("div")
+        element.remove_css_classes("foo")
+        element.add_css_classes()
+        assert_false(element.has_css_class("foo"))
+        assert_equal("<div></div>", str(element))
+
     def test_has_css_class(self):
         element = Element("div")
         element.add_css_classes("foo")
@@ -160,6 +269,32 @@ class ElementTest(TestCase):
             css_classes,
         )
 
+    def test_start_tag_cache(self):
+        element = Element("div")
+        assert_equal("<div>", element.render_start_tag() + ">")
+        element.set_attribute("foo", "bar")
+        assert_equal('<div foo="bar">', element.render_start_tag() + ">")
+        element.add_css_classes("cls")
+        assert_equal(
+            '<div foo="bar" class="cls">', element.render_start_tag() + ">"
+        )
+        element.set_style("color", "red")
+        element.remove_css_classes("cls")
+        element.remove_attribute("foo")
+        assert_equal(
+            '<div style="color: red">', element.render_start_tag() + ">"
+        )
+        element.data["x"] = "y"
+        assert_equal(
+            '<div data-x="y" style="color: red">',
+            element.render_start_tag() + ">",
+        )
+        del element.data["x"]
+        element.element_name = "span"
+        assert_equal(
+            '<span style="color: red">', element.render_start_tag() + ">"
+        )
+
     def test_id(self):
         element = Element("div")
         element.id = "Test-ID"
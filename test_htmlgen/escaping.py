@@ -0,0 +1,126 @@
+from unittest import TestCase
+
+from asserts import assert_equal, assert_is, assert_true
+
+import htmlgen.escaping
+from htmlgen.escaping import (
+    escape_html,
+    escape_text,
+    escape_text_list,
+    escape_attribute,
+    set_conservative_escaping,
+)
+
+
+class EscapeHTMLTest(TestCase):
+    def setUp(self):
+        htmlgen.escaping._cache.clear()
+
+    def tearDown(self):
+        htmlgen.escaping._cache.clear()
+
+    def test_no_reserved_characters(self):
+        s = "".join(["Foo", "Bar"])
+        assert_is(s, escape_html(s))
+
+    def test_reserved_characters(self):
+        assert_equal(
+            "&lt;a href=&quot;&amp;&quot;&gt;It&#x27;s&lt;/a&gt;",
+            escape_html('<a href="&">It\'s</a>'),
+        )
+
+    def test_empty(self):
+        assert_equal("", escape_html(""))
+
+    def test_long_string(self):
+        s = "&" * (htmlgen.escaping.CACHE_MAX_LENGTH + 1)
+        assert_equal("&amp;" * len(s), escape_html(s))
+        assert_equal(0, len(htmlgen.escaping._cache))
+
+    def test_cache(self):
+        assert_equal("a &amp; b", escape_html("a & b"))
+        assert_equal("a &amp; b", escape_html("a & b"))
+        assert_equal({"a & b": "a &amp; b"}, htmlgen.escaping._cache)
+
+    def test_cache_is_bounded(self):
+        for i in range(htmlgen.escaping.CACHE_SIZE + 10):
+            escape_html(str(i))
+        assert_true(
+            len(htmlgen.escaping._cache) <= htmlgen.escaping.CACHE_SIZE
+        )
+        assert_equal("1&amp;2", escape_html("1&2"))
+
+
+class EscapeTextTest(TestCase):
+    def tearDown(self):
+        set_conservative_escaping(False)
+
+    def test_no_reserved_characters(self):
+        s = "".join(["Foo", "Bar"])
+        assert_is(s, escape_text(s))
+
+    def test_reserved_characters(self):
+        assert_equal(
+            '&lt;a href="&amp;"&gt;It\'s&lt;/a&gt;',
+            escape_text('<a href="&">It\'s</a>'),
+        )
+
+    def test_long_string(self):
+        length = htmlgen.escaping.CACHE_MAX_LENGTH
+        assert_equal("&lt;'" * length, escape_text("<'" * length))
+
+    def test_conservative(self):
+        assert_equal("It's", escape_text("It's"))
+        set_conservative_escaping(True)
+        assert_equal("It&#x27;s", escape_text("It's"))
+        long = "'" * (htmlgen.escaping.CACHE_MAX_LENGTH + 1)
+        assert_equal("&#x27;" * len(long), escape_text(long))
+        set_conservative_escaping(False)
+        assert_equal("It's", escape_text("It's"))
+
+
+class EscapeTextListTest(TestCase):
+    def tearDown(self):
+        set_conservative_escaping(False)
+
+    def test_no_reserved_characters(self):
+        values = ["Foo", "It's"]
+        assert_is(values, escape_text_list(values))
+
+    def test_reserved_characters(self):
+        assert_equal(
+            ["a &amp; b", "It's", "&lt;b&gt;"],
+            escape_text_list(["a & b", "It's", "<b>"]),
+        )
+
+    def test_empty(self):
+        assert_equal([], escape_text_list([]))
+
+    def test_separator_in_values(self):
+        assert_equal(["a\x00&amp;", "&lt;"], escape_text_list(["a\x00&", "<"]))
+
+    def test_conservative(self):
+        set_conservative_escaping(True)
+        assert_equal(["It&#x27;s"], escape_text_list(["It's"]))
+        assert_equal(["It&#x27;s", "&amp;"], escape_text_list(["It's", "&"]))
+
+
+class EscapeAttributeTest(TestCase):
+    def tearDown(self):
+        set_conservative_escaping(False)
+
+    def test_no_reserved_characters(self):
+        s = "".join(["Foo", "Bar"])
+        assert_is(s, escape_attribute(s))
+
+    def test_reserved_characters(self):
+        assert_equal(
+            "<a href=&quot;&amp;&quot;>It's</a>",
+            escape_attribute('<a href="&">It\'s</a>'),
+        )
+
+    def test_conservative(self):
+        set_conservative_escaping(True)
+        assert_equal("&lt;It&#x27;s&gt;", escape_attribute("<It's>"))
+        set_conservative_escaping(False)
+        assert_equal("<It's>", escape_attribute("<It's>"))
@@ -0,0 +1,157 @@
+import datetime
+from decimal import Decimal
+from unittest import TestCase, skipIf
+
+from asserts import assert_equal, assert_is, assert_raises
+
+from htmlgen.escaping import set_conservative_escaping
+from htmlgen.formatting import format_strings, format_decimals, format_dates
+
+try:
+    import numpy
+except ImportError:
+    has_numpy = False
+else:
+    has_numpy = True
+
+
+class FormatStringsTest(TestCase):
+    def test_no_reserved_characters(self):
+        values = ["Foo", "Bar"]
+        assert_is(values, format_strings(values))
+
+    def test_reserved_characters(self):
+        assert_equal(
+            ["Tom &amp; Jerry", "It's", "&lt;b&gt;"],
+            format_strings(["Tom & Jerry", "It's", "<b>"]),
+        )
+
+    def test_conservative_escaping(self):
+        set_conservative_escaping(True)
+        try:
+            assert_equal(["It&#x27;s &amp;"], format_strings(["It's &"]))
+        finally:
+            set_conservative_escaping(False)
+
+    def test_conservative_escaping__quotes_only(self):
+        set_conservative_escaping(True)
+        try:
+            assert_equal(
+                ["It&#x27;s", "&quot;x&quot;"],
+                format_strings(["It's", '"x"']),
+            )
+        finally:
+            set_conservative_escaping(False)
+
+    def test_separator_in_values(self):
+        assert_equal(["a\x00b", "&lt;"], format_strings(["a\x00b", "<"]))
+
+    def test_tuple(self):
+        assert_equal(["&amp;", "x"], format_strings(("&", "x")))
+
+    def test_empty(self):
+        assert_equal([], format_strings([]))
+
+    def test_not_a_string(self):
+        with assert_raises(TypeError):
+            format_strings(["&", 5])  # type: ignore
+
+    @skipIf(not has_numpy, "NumPy is not installed")
+    def test_numpy(self):
+        assert_equal(
+            ["a &amp; b", "c"], format_strings(numpy.array(["a & b", "c"]))
+        )
+
+
+class FormatDecimalsTest(TestCase):
+    def test_default(self):
+        assert_equal(
+            ["1.00", "-2.50", "1234567.89", "0.00"],
+            format_decimals([1, -2.5, 1234567.891, 0.0001]),
+        )
+
+    def test_decimals(self):
+        assert_equal(["1", "3"], format_decimals([1.4, 2.6], 0))
+        assert_equal(["2.5000"], format_decimals([2.5], 4))
+
+    def test_decimal_objects(self):
+        assert_equal(["1.13"], format_decimals([Decimal("1.126")]))
+
+    def test_thousands_separator(self):
+        assert_equal(
+            ["1,234,567.89", "-1,000.00", "999.00"],
+            format_decimals(
+                [1234567.891, -1000, 999], thousands_separator=","
+            ),
+        )
+
+    def test_custom_thousands_separator(self):
+        assert_equal(
+            ["1 234.50"],
+            format_decimals([1234.5], thousands_separator=" "),
+        )
+
+    def test_thousands_separator_is_escaped(self):
+        assert_equal(
+            ["1&amp;000"], format_decimals([1000], 0, thousands_separator="&")
+        )
+
+    def test_decimal_separator(self):
+        assert_equal(
+            ["1234,50", "-0,25"],
+            format_decimals([1234.5, -0.25], decimal_separator=","),
+        )
+
+    def test_swapped_separators(self):
+        assert_equal(
+            ["1.234.567,89", "-1.000,00"],
+            format_decimals(
+                [1234567.891, -1000],
+                thousands_separator=".",
+                decimal_separator=",",
+            ),
+        )
+
+    def test_decimal_separator_is_escaped(self):
+        assert_equal(
+            ["1&lt;50"], format_decimals([1.5], decimal_separator="<")
+        )
+
+    def test_same_separators(self):
+        with assert_raises(ValueError):
+            format_decimals([1000], thousands_separator=".")
+
+    def test_not_a_number(self):
+        with assert_raises(ValueError):
+            format_decimals(["foo"])
+
+    @skipIf(not has_numpy, "NumPy is not installed")
+    def test_numpy(self):
+        values = numpy.array([1234.5, -0.25, 3])
+        assert_equal(
+            ["1,234.50", "-0.25", "3.00"],
+            format_decimals(values, thousands_separator=","),
+        )
+
+
+class FormatDatesTest(TestCase):
+    def test_dates(self):
+        assert_equal(
+            ["2020-01-31", "1999-12-01"],
+            format_dates(
+                [datetime.date(2020, 1, 31), datetime.date(1999, 12, 1)]
+            ),
+        )
+
+    def test_datetimes(self):
+        assert_equal(
+            ["2020-01-31T12:30:00"],
+            format_dates([datetime.datetime(2020, 1, 31, 12, 30)]),
+        )
+
+    @skipIf(not has_numpy, "NumPy is not installed")
+    def test_numpy(self):
+        values = numpy.array(
+            ["2020-01-31", "1999-12-01"], dtype="datetime64[D]"
+        )
+        assert_equal(["2020-01-31", "1999-12-01"], format_dates(values))
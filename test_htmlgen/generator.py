@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*-
 
+import io
+import pickle
+import threading
+from typing import List
 from unittest import TestCase
 
-from asserts import assert_equal, assert_raises, assert_is_instance, assert_is
+from asserts import (
+    assert_equal,
+    assert_raises,
+    assert_is_instance,
+    assert_is,
+    assert_true,
+)
 
+import htmlgen.generator
 from htmlgen.generator import (
     Generator,
     NullGenerator,
+    FlushGenerator,
+    FrozenGenerator,
     IteratorGenerator,
     ChildGenerator,
     HTMLChildGenerator,
@@ -24,6 +37,14 @@ class _TestingGenerator(Generator):
         return iter(self._items)
 
 
+class _WriteOnlyFile(object):
+    def __init__(self):
+        self.written = []  # type: List[bytes]
+
+    def write(self, s):
+        self.written.append(s)
+
+
 class GeneratorTest(TestCase):
     def test_empty_generate(self):
         generator = _TestingGenerator([])
@@ -55,17 +76,241 @@ class GeneratorTest(TestCase):
         generator = _TestingGenerator([inner2, u"baz"])
         assert_equal([b"foo", b"bar", b"baz"], list(iter(generator)))
 
+    def test_generate_str_and_bytes_subclasses(self):
+        class MyStr(str):
+            pass
+
+        class MyBytes(bytes):
+            pass
+
+        generator = _TestingGenerator([MyStr(u"bär"), MyBytes(b"foo")])
+        assert_equal([b"b\xc3\xa4r", b"foo"], list(iter(generator)))
+        assert_equal([u"bär", u"foo"], list(generator.iter_text()))
+        assert_is(str, type(next(generator.iter_text())))
+
+    def test_generate_duck_typed_generator(self):
+        class DuckGenerator(object):
+            pass
+
+        duck = DuckGenerator()
+        duck.generate = lambda: iter([u"bar"])  # type: ignore
+        generator = _TestingGenerator([u"foo", duck])
+        assert_equal([b"foo", b"bar"], list(iter(generator)))
+
+    def test_generate_returns_list(self):
+        class ListGenerator(Generator):
+            def generate(self):
+                return [u"foo", _TestingGenerator([u"bar"]), u"baz"]
+
+        assert_equal([b"foo", b"bar", b"baz"], list(iter(ListGenerator())))
+
     def test_str(self):
         inner = _TestingGenerator([u"bar"])
         generator = _TestingGenerator([u"foo", inner, u"baz"])
         assert_equal("foobarbaz", str(generator))
 
+    def test_interleaved_iteration(self):
+        inner = _TestingGenerator([u"bar", u"baz"])
+        generator = _TestingGenerator([u"foo", inner])
+        it1 = iter(generator)
+        it2 = iter(generator)
+        assert_equal(b"foo", next(it1))
+        assert_equal(b"foo", next(it2))
+        assert_equal(b"bar", next(it1))
+        assert_equal([b"bar", b"baz"], list(it2))
+        assert_equal([b"baz"], list(it1))
+
+    def test_nested_iteration(self):
+        class NestedGenerator(Generator):
+            def __init__(self):
+                self.calls = 0
+
+            def generate(self):
+                self.calls += 1
+                if self.calls == 1:
+                    yield u"[" + str(outer) + u"]"
+
+        outer = _TestingGenerator([u"a", NestedGenerator(), u"b"])
+        assert_equal(u"a[ab]b", str(outer))
+
+    def test_iterate_from_threads(self):
+        inner = _TestingGenerator([u"x"] * 100)
+        generator = _TestingGenerator([inner] * 100)
+        results = []  # type: List[str]
+
+        def render():
+            results.append(str(generator))
+
+        threads = [threading.Thread(target=render) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_equal([u"x" * 10000] * 8, results)
+
+    def test_no_state_after_iteration(self):
+        generator = _TestingGenerator([u"foo"])
+        list(iter(generator))
+        assert_equal({"_items": [u"foo"]}, vars(generator))
+
+    def test_iter_text(self):
+        inner = _TestingGenerator([b"b\xc3\xa4r"])
+        generator = _TestingGenerator([u"fooß", inner])
+        assert_equal([u"fooß", u"bär"], list(generator.iter_text()))
+
+    def test_render(self):
+        inner = _TestingGenerator([b"b\xc3\xa4r"])
+        generator = _TestingGenerator([u"foo", inner, u"baz"])
+        assert_equal(u"foobärbaz", generator.render())
+
+    def test_item_kind_cache_is_bounded(self):
+        for _ in range(htmlgen.generator._ITEM_KINDS_SIZE + 10):
+            item_type = type("Text", (str,), {})
+            assert_equal(b"x", b"".join(_TestingGenerator([item_type("x")])))
+        assert_true(
+            len(htmlgen.generator._item_kinds)
+            <= htmlgen.generator._ITEM_KINDS_SIZE
+        )
+
+    def test_class_gains_generate_method(self):
+        class Item(object):
+            pass
+
+        generator = _TestingGenerator([Item()])
+        with assert_raises(TypeError):
+            list(generator)
+        Item.generate = lambda self: iter([u"foo"])  # type: ignore
+        assert_equal([b"foo"], list(generator))
+
+    def test_iter_with_markers(self):
+        class Marker(_TestingGenerator):
+            pass
+
+        marker = Marker([u"not flattened"])
+        inner = _TestingGenerator([marker, b"b\xc3\xa4r"])
+        generator = _TestingGenerator([u"foo", inner])
+        items = list(generator.iter_with_markers(False, [Marker]))
+        assert_equal(3, len(items))
+        assert_equal(b"foo", items[0])
+        assert_is(marker, items[1])
+        assert_equal(b"b\xc3\xa4r", items[2])
+        assert_equal(
+            [u"foo", marker, u"bär"],
+            list(generator.iter_with_markers(True, [Marker])),
+        )
+
+    def test_iter_with_markers__no_markers(self):
+        inner = _TestingGenerator([u"bar"])
+        generator = _TestingGenerator([u"foo", inner])
+        assert_equal(
+            [u"foo", u"bar"], list(generator.iter_with_markers(True, []))
+        )
+
+    def test_iter_chunks(self):
+        inner = _TestingGenerator([u"bär", b"baz"])
+        generator = _TestingGenerator([u"foo", inner, u"x"])
+        assert_equal(
+            [b"foob\xc3\xa4r", b"bazx"],
+            list(generator.iter_chunks(min_size=5)),
+        )
+
+    def test_iter_chunks__default_size(self):
+        generator = _TestingGenerator([u"foo", b"bar"])
+        assert_equal([b"foobar"], list(generator.iter_chunks()))
+
+    def test_iter_chunks__large_fragment(self):
+        generator = _TestingGenerator([b"a", b"bbbbb", b"ccccc", b"d"])
+        assert_equal(
+            [b"abbbbb", b"ccccc", b"d"],
+            list(generator.iter_chunks(min_size=4)),
+        )
+
+    def test_iter_chunks__flush(self):
+        inner = _TestingGenerator([u"bar", FlushGenerator()])
+        generator = _TestingGenerator(
+            [FlushGenerator(), u"foo", inner, FlushGenerator(), u"baz"]
+        )
+        assert_equal([b"foobar", b"baz"], list(generator.iter_chunks()))
+
+    def test_flush_ignored_by_iter(self):
+        generator = _TestingGenerator([u"foo", FlushGenerator(), u"bar"])
+        assert_equal([b"foo", b"bar"], list(iter(generator)))
+
+    def test_write_to(self):
+        inner = _TestingGenerator([u"bär"])
+        generator = _TestingGenerator([u"foo", inner, b"baz"])
+        fp = io.BytesIO()
+        generator.write_to(fp)
+        assert_equal(b"foob\xc3\xa4rbaz", fp.getvalue())
+
+    def test_write_to__write_only(self):
+        generator = _TestingGenerator([u"foo", FlushGenerator(), b"bar"])
+        fp = _WriteOnlyFile()
+        generator.write_to(fp)
+        assert_equal([b"foo", b"bar"], fp.written)
+
+    def test_write_to__no_chunks(self):
+        generator = _TestingGenerator([u"foo", b"bar"])
+        fp = _WriteOnlyFile()
+        generator.write_to(fp, min_size=None)
+        assert_equal([b"foo", b"bar"], fp.written)
+
+    def test_write_text_to(self):
+        inner = _TestingGenerator([b"b\xc3\xa4r"])
+        generator = _TestingGenerator([u"foo", inner, u"baz"])
+        fp = io.StringIO()
+        generator.write_text_to(fp)
+        assert_equal(u"foobärbaz", fp.getvalue())
+
     def test_invalid_class(self):
         generator = _TestingGenerator([5])
         with assert_raises(TypeError):
             str(generator)
 
 
+class FrozenGeneratorTest(TestCase):
+    def test_generate(self):
+        frozen = FrozenGenerator(u"<p>bär</p>")
+        assert_equal([b"<p>b\xc3\xa4r</p>"], list(iter(frozen)))
+        assert_equal([u"<p>bär</p>"], list(frozen.iter_text()))
+        assert_equal(u"<p>bär</p>", frozen.text)
+        assert_equal(b"<p>b\xc3\xa4r</p>", frozen.encoded)
+
+    def test_sub_generator(self):
+        frozen = FrozenGenerator(u"<p>bär</p>")
+        generator = _TestingGenerator([u"foo", frozen])
+        assert_equal([b"foo", b"<p>b\xc3\xa4r</p>"], list(iter(generator)))
+        assert_equal([u"foo", u"<p>bär</p>"], list(generator.iter_text()))
+
+    def test_immutable(self):
+        frozen = FrozenGenerator(u"foo")
+        with assert_raises(AttributeError):
+            frozen.text = u"bar"
+        with assert_raises(AttributeError):
+            frozen.foo = u"bar"  # type: ignore
+        with assert_raises(AttributeError):
+            del frozen.encoded
+        assert_equal(u"foo", frozen.text)
+
+    def test_freeze(self):
+        inner = _TestingGenerator([u"bär"])
+        generator = ChildGenerator()
+        generator.extend([u"foo", inner])
+        frozen = generator.freeze()
+        generator.append(u"baz")
+        assert_is_instance(frozen, FrozenGenerator)
+        assert_equal(u"foobär", frozen.text)
+
+    def test_freeze_frozen(self):
+        frozen = FrozenGenerator(u"foo")
+        assert_is(frozen, frozen.freeze())
+
+    def test_pickle(self):
+        frozen = pickle.loads(pickle.dumps(FrozenGenerator(u"bär")))
+        assert_equal(u"bär", frozen.text)
+        assert_equal(b"b\xc3\xa4r", frozen.encoded)
+
+
 class NullGeneratorTest(TestCase):
     def test_generate(self):
         assert_equal([], list(iter(NullGenerator())))
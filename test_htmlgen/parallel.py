@@ -0,0 +1,104 @@
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    Executor,
+)
+from typing import Any, List
+from unittest import TestCase
+
+from asserts import assert_equal, assert_raises, assert_true
+
+from htmlgen import Division, Span, TableBody
+from htmlgen.generator import Generator, ChildGenerator
+from htmlgen.parallel import ParallelGenerator, render_parallel, iter_parallel
+
+
+class _RecordingExecutor(Executor):
+    def __init__(self):
+        self.futures = []  # type: List[Future[Any]]
+
+    def submit(self, fn, *args, **kwargs):  # type: ignore
+        future = Future()  # type: Future[Any]
+        future.set_result(fn(*args, **kwargs))
+        self.futures.append(future)
+        return future
+
+
+class _FailingGenerator(Generator):
+    def generate(self):
+        raise ValueError()
+
+
+def _create_body(i):
+    body = TableBody()
+    for j in range(3):
+        body.create_row().create_cells(str(i), str(j))
+    return body
+
+
+class ParallelGeneratorTest(TestCase):
+    def test_generate(self):
+        generator = ParallelGenerator(Span("<Foo>"))
+        assert_equal("<span>&lt;Foo&gt;</span>", str(generator))
+
+
+class RenderParallelTest(TestCase):
+    def test_no_marked_trees(self):
+        executor = _RecordingExecutor()
+        div = Division("Foo", Span("Bar"))
+        assert_equal(
+            b"<div>Foo<span>Bar</span></div>", render_parallel(div, executor)
+        )
+        assert_equal([], executor.futures)
+
+    def test_marked_trees(self):
+        executor = _RecordingExecutor()
+        div = Division("Foo", ParallelGenerator(Span("Bär")), "Baz")
+        div.append(ParallelGenerator(Span("Qux")))
+        assert_equal(
+            b"<div>Foo<span>B\xc3\xa4r</span>Baz<span>Qux</span></div>",
+            render_parallel(div, executor),
+        )
+        assert_equal(2, len(executor.futures))
+
+    def test_thread_pool(self):
+        generator = ChildGenerator()
+        for i in range(10):
+            generator.append(ParallelGenerator(_create_body(i)))
+        with ThreadPoolExecutor(4) as executor:
+            result = render_parallel(generator, executor)
+        assert_equal(b"".join(iter(generator)), result)
+
+    def test_process_pool(self):
+        generator = ChildGenerator()
+        for i in range(3):
+            generator.append(ParallelGenerator(_create_body(i)))
+        with ProcessPoolExecutor(2) as executor:
+            result = render_parallel(generator, executor)
+        assert_equal(b"".join(iter(generator)), result)
+
+    def test_error(self):
+        generator = ChildGenerator()
+        generator.append(ParallelGenerator(_FailingGenerator()))
+        with ThreadPoolExecutor(1) as executor:
+            with assert_raises(ValueError):
+                render_parallel(generator, executor)
+
+    def test_iter_parallel(self):
+        executor = _RecordingExecutor()
+        div = Division(ParallelGenerator(Span("Foo")), "Bar")
+        iterator = iter_parallel(div, executor)
+        assert_equal(b"<div>", next(iterator))
+        assert_equal(1, len(executor.futures))
+        assert_equal([b"<span>Foo</span>", b"Bar</div>"], list(iterator))
+
+    def test_iter_parallel__cancel_when_closed(self):
+        executor = _RecordingExecutor()
+        pending = Future()  # type: Future[bytes]
+        executor.submit = lambda *args: pending  # type: ignore
+        div = Division("Foo", ParallelGenerator(Span("Bar")))
+        iterator = iter_parallel(div, executor)
+        next(iterator)
+        iterator.close()  # type: ignore
+        assert_true(pending.cancelled())
@@ -1,8 +1,34 @@
+import asyncio
+import gc
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from unittest import TestCase
 
-from asserts import assert_equal, assert_true
-
-from htmlgen import Table, TableHead, TableRow, TableCell, ColumnGroup, Span
+from asserts import assert_equal, assert_raises, assert_true
+
+from htmlgen import (
+    Table,
+    TableHead,
+    ColumnarTableBody,
+    TableWindow,
+    TablePager,
+    AsyncTableBody,
+    TableRow,
+    RowTemplate,
+    TableCell,
+    ColumnGroup,
+    Span,
+    FragmentCache,
+    fragment_cache,
+    Slot,
+)
+from htmlgen.asynchronous import AsyncFlattener
+from htmlgen.formatting import format_decimals, format_strings
+from htmlgen.table import ROWS_PER_BATCH
+
+
+class _Text(str):
+    pass
 
 
 class TableTest(TestCase):
@@ -182,6 +208,88 @@ class TableTest(TestCase):
         table = MyTable()
         assert_equal("<table><tbody><tr></tr></tbody></table>", str(table))
 
+    def test_generate_rows__streaming(self):
+        generated = []  # type: List[int]
+
+        class MyTable(Table):
+            def generate_rows(self):
+                for i in range(3):
+                    generated.append(i)
+                    yield TableRow()
+
+        chunks = iter(MyTable())
+        assert_equal(
+            [b"<table>", b"<tbody>", b"<tr>"], list(islice(chunks, 3))
+        )
+        assert_equal([0], generated)
+        assert_equal(b"</tr>", next(chunks))
+        assert_equal(b"<tr>", next(chunks))
+        assert_equal([0, 1], generated)
+
+    def test_generate_rows__empty_iterator(self):
+        class MyTable(Table):
+            def generate_header_rows(self):
+                return iter([])
+
+            def generate_rows(self):
+                return iter([])
+
+        assert_equal("<table></table>", str(MyTable()))
+
+    def test_generate_rows__strings(self):
+        class MyTable(Table):
+            def generate_rows(self):
+                yield "<tr>"
+
+        assert_equal(
+            "<table><tbody>&lt;tr&gt;</tbody></table>", str(MyTable())
+        )
+
+    def test_generate_rows__with_explicit_rows(self):
+        class MyTable(Table):
+            def generate_header_rows(self):
+                yield TableRow()
+
+            def generate_rows(self):
+                yield TableRow()
+
+        table = MyTable()
+        table.create_header_row().create_cell("H")
+        table.create_row().create_cell("B")
+        assert_equal(
+            "<table><thead><tr><td>H</td></tr></thead>"
+            "<thead><tr></tr></thead>"
+            "<tbody><tr><td>B</td></tr></tbody>"
+            "<tbody><tr></tr></tbody></table>",
+            str(table),
+        )
+
+    def test_from_columns(self):
+        table = Table.from_columns({"Name": ["<A>", "B"], "Count": [1, 2]})
+        assert_equal(
+            "<table><thead><tr><th>Name</th><th>Count</th></tr></thead>"
+            "<tbody><tr><td>&lt;A&gt;</td><td>1</td></tr>"
+            "<tr><td>B</td><td>2</td></tr></tbody></table>",
+            str(table),
+        )
+
+    def test_from_columns__formatters(self):
+        table = Table.from_columns(
+            {"Name": ["A"], "Price": [1]},
+            formatters={"Price": format_decimals},
+        )
+        assert_equal(
+            "<table><thead><tr><th>Name</th><th>Price</th></tr></thead>"
+            "<tbody><tr><td>A</td><td>1.00</td></tr></tbody></table>",
+            str(table),
+        )
+
+    def test_from_columns__unknown_formatter(self):
+        with assert_raises(ValueError):
+            Table.from_columns(
+                {"Name": ["A"]}, formatters={"Price": format_decimals}
+            )
+
 
 class TableHeadTest(TestCase):
     def test_create_row(self):
@@ -191,6 +299,508 @@ class TableHeadTest(TestCase):
         assert_equal('<thead><tr id="my-row"></tr></thead>', str(head))
 
 
+class ColumnarTableBodyTest(TestCase):
+    def test_empty(self):
+        body = ColumnarTableBody([])
+        assert_equal(0, body.row_count)
+        assert_equal("<tbody></tbody>", str(body))
+
+    def test_columns(self):
+        names = ["Foo", "Bar"]
+        body = ColumnarTableBody([names, [1.5, None]])
+        assert_equal(2, body.row_count)
+        assert_equal([names, [1.5, None]], body.columns)
+        assert_equal(
+            "<tbody><tr><td>Foo</td><td>1.5</td></tr>"
+            "<tr><td>Bar</td><td>None</td></tr></tbody>",
+            str(body),
+        )
+
+    def test_escape(self):
+        body = ColumnarTableBody([["<Foo>"], [_Text("A&B")]])
+        assert_equal(
+            "<tbody><tr><td>&lt;Foo&gt;</td><td>A&amp;B</td></tr></tbody>",
+            str(body),
+        )
+
+    def test_generators(self):
+        body = ColumnarTableBody([[Span("<Foo>")], ["Bar"]])
+        body.id = "body"
+        assert_equal(
+            '<tbody id="body"><tr><td><span>&lt;Foo&gt;</span></td>'
+            "<td>Bar</td></tr></tbody>",
+            str(body),
+        )
+
+    def test_columns_of_different_length(self):
+        with assert_raises(ValueError):
+            ColumnarTableBody([["Foo"], ["Bar", "Baz"]])
+
+    def test_formatters(self):
+        body = ColumnarTableBody(
+            [["<Foo>", "Bar"], [1, 2.5], [3, 4]],
+            formatters=[format_strings, format_decimals, None],
+        )
+        assert_equal(
+            "<tbody><tr><td>&lt;Foo&gt;</td><td>1.00</td><td>3</td></tr>"
+            "<tr><td>Bar</td><td>2.50</td><td>4</td></tr></tbody>",
+            str(body),
+        )
+
+    def test_formatters_with_generators(self):
+        body = ColumnarTableBody(
+            [[Span("Foo")], [1]], formatters=[None, format_decimals]
+        )
+        assert_equal(
+            "<tbody><tr><td><span>Foo</span></td><td>1.00</td></tr></tbody>",
+            str(body),
+        )
+
+    def test_formatters_are_called_per_batch(self):
+        batches = []  # type: List[int]
+
+        def formatter(values):
+            batches.append(len(values))
+            return [str(value) for value in values]
+
+        count = ROWS_PER_BATCH + 1
+        body = ColumnarTableBody([range(count)], formatters=[formatter])
+        html = str(body)
+        assert_equal([ROWS_PER_BATCH, 1], batches)
+        assert_equal(count, html.count("<tr>"))
+        last_row = "<tr><td>{}</td></tr></tbody>".format(count - 1)
+        assert_true(html.endswith(last_row))
+
+    def test_wrong_number_of_formatters(self):
+        with assert_raises(ValueError):
+            ColumnarTableBody([["Foo"], ["Bar"]], formatters=[None])
+
+    def test_formatter_returns_too_few_values(self):
+        body = ColumnarTableBody([[1, 2, 3]], formatters=[lambda v: ["x"]])
+        with assert_raises(ValueError):
+            str(body)
+
+    def test_formatter_returns_too_many_values(self):
+        body = ColumnarTableBody([[1]], formatters=[lambda v: ["x", "y"]])
+        with assert_raises(ValueError):
+            str(body)
+
+
+class _RowSource(Sequence[Tuple[str, int]]):
+    """Row source that records the slices that are requested."""
+
+    def __init__(self, length):
+        # type: (int) -> None
+        self.length = length
+        self.slices = []  # type: List[Tuple[int, int]]
+
+    def __len__(self):
+        # type: () -> int
+        return self.length
+
+    def __getitem__(self, index):
+        # type: (Any) -> Any
+        assert isinstance(index, slice)
+        start, stop, _ = index.indices(self.length)
+        self.slices.append((start, stop))
+        return [(str(i), i * 2) for i in range(start, stop)]
+
+
+class TableWindowTest(TestCase):
+    def test_window(self):
+        rows = [("<A>", 1), ("B", 2), ("C", 3)]
+        assert_equal(
+            "<tbody><tr><td>&lt;A&gt;</td><td>1</td></tr>"
+            "<tr><td>B</td><td>2</td></tr></tbody>",
+            str(TableWindow(rows, 0, 2)),
+        )
+
+    def test_empty(self):
+        assert_equal("<tbody></tbody>", str(TableWindow([], 0, 10)))
+
+    def test_formatters(self):
+        window = TableWindow(
+            [("A", 1), ("B", 2)], 1, 2, [format_strings, format_decimals]
+        )
+        assert_equal(
+            "<tbody><tr><td>B</td><td>2.00</td></tr></tbody>", str(window)
+        )
+
+    def test_batches(self):
+        source = _RowSource(ROWS_PER_BATCH * 3)
+        html = str(TableWindow(source, 10, ROWS_PER_BATCH + 20))
+        assert_equal(
+            [
+                (10, ROWS_PER_BATCH + 10),
+                (ROWS_PER_BATCH + 10, ROWS_PER_BATCH + 20),
+            ],
+            source.slices,
+        )
+        assert_equal(ROWS_PER_BATCH + 10, html.count("<tr>"))
+        assert_true(html.startswith("<tbody><tr><td>10</td><td>20</td></tr>"))
+
+    def test_empty_range(self):
+        assert_equal("<tbody></tbody>", str(TableWindow([("a",)], 1, 1)))
+
+    def test_negative_start(self):
+        with assert_raises(ValueError):
+            TableWindow([("a",)], -2, 5)
+
+    def test_stop_before_start(self):
+        with assert_raises(ValueError):
+            TableWindow([("a",)], 3, 2)
+
+    def test_rows_of_different_length(self):
+        with assert_raises(ValueError):
+            str(TableWindow([("a", 1, "x"), ("b",)], 0, 2))
+
+    def test_rows_of_different_length_in_later_batch(self):
+        rows = [("a", 1)] * ROWS_PER_BATCH + [("b",)]
+        with assert_raises(ValueError):
+            str(TableWindow(rows, 0, len(rows)))
+
+    def test_too_few_formatters(self):
+        with assert_raises(ValueError):
+            str(TableWindow([("a", 1)], 0, 1, [format_strings]))
+
+    def test_formatter_returns_too_few_values(self):
+        window = TableWindow([("a",), ("b",)], 0, 2, [lambda v: ["x"]])
+        with assert_raises(ValueError):
+            str(window)
+
+    def test_too_many_formatters(self):
+        window = TableWindow([("a",)], 0, 1, [format_strings, None])
+        with assert_raises(ValueError):
+            str(window)
+
+
+class TablePagerTest(TestCase):
+    def test_page_count(self):
+        assert_equal(1, TablePager("t", [], page_size=10).page_count)
+        pager = TablePager("t", _RowSource(10), page_size=10)
+        assert_equal(1, pager.page_count)
+        pager = TablePager("t", _RowSource(11), page_size=10)
+        assert_equal(2, pager.page_count)
+
+    def test_invalid_page_size(self):
+        with assert_raises(ValueError):
+            TablePager("t", [], page_size=0)
+
+    def test_wrong_number_of_formatters(self):
+        with assert_raises(ValueError):
+            TablePager("t", [("a", 1)], formatters=[format_strings])
+
+    def test_formatters_without_rows(self):
+        pager = TablePager("t", [], formatters=[format_strings])
+        assert_equal(1, pager.page_count)
+
+    def test_rows_of_different_length(self):
+        pager = TablePager("t", [("a", 1), ("b",)], cache=FragmentCache())
+        with assert_raises(ValueError):
+            str(pager.page(0))
+
+    def test_page(self):
+        pager = TablePager(
+            "t", _RowSource(5), page_size=2, cache=FragmentCache()
+        )
+        assert_equal(
+            "<tbody><tr><td>2</td><td>4</td></tr>"
+            "<tr><td>3</td><td>6</td></tr></tbody>",
+            str(pager.page(1)),
+        )
+        assert_equal(
+            "<tbody><tr><td>4</td><td>8</td></tr></tbody>", str(pager.page(2))
+        )
+
+    def test_empty_page(self):
+        pager = TablePager("t", [], cache=FragmentCache())
+        assert_equal("<tbody></tbody>", str(pager.page(0)))
+
+    def test_page_does_not_exist(self):
+        pager = TablePager("t", _RowSource(5), page_size=2)
+        with assert_raises(IndexError):
+            pager.page(3)
+        with assert_raises(IndexError):
+            pager.page(-1)
+
+    def test_cache(self):
+        source = _RowSource(5)
+        cache = FragmentCache()
+        pager = TablePager("t", source, page_size=2, cache=cache)
+        first = str(pager.page(1))
+        assert_equal(first, str(pager.page(1)))
+        assert_equal([(2, 4)], source.slices)
+        assert_equal(1, len(cache))
+        assert_true(("t", 0, 2, 1) in cache)
+
+    def test_version(self):
+        source = _RowSource(5)
+        pager = TablePager("t", source, page_size=2, cache=FragmentCache())
+        str(pager.page(0))
+        pager.version += 1
+        str(pager.page(0))
+        str(pager.page(0))
+        assert_equal([(0, 2), (0, 2)], source.slices)
+
+    def test_default_cache(self):
+        pager = TablePager("test-table-pager", [("x",)])
+        try:
+            str(pager.page(0))
+            assert_true(("test-table-pager", 0, 100, 0) in fragment_cache)
+        finally:
+            fragment_cache.invalidate(("test-table-pager", 0, 100, 0))
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class _AsyncRows(object):
+    """Asynchronous row source that records how many rows were fetched."""
+
+    def __init__(self, rows, error=None):
+        # type: (List[Any], Optional[Exception]) -> None
+        self._rows = iter(rows)
+        self._error = error
+        self.fetched = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        for row in self._rows:
+            self.fetched += 1
+            return row
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration()
+
+
+class AsyncTableBodyTest(TestCase):
+    def test_tuples(self):
+        body = AsyncTableBody(_AsyncRows([("<A>", 1), ("B", 2)]))
+        assert_equal(
+            "<tbody><tr><td>&lt;A&gt;</td><td>1</td></tr>"
+            "<tr><td>B</td><td>2</td></tr></tbody>",
+            _run(body.arender()),
+        )
+
+    def test_empty(self):
+        body = AsyncTableBody(_AsyncRows([]))
+        assert_equal("<tbody></tbody>", _run(body.arender()))
+
+    def test_attributes(self):
+        body = AsyncTableBody(_AsyncRows([]))
+        body.id = "my-body"
+        assert_equal('<tbody id="my-body"></tbody>', _run(body.arender()))
+
+    def test_mappings(self):
+        rows = [{"a": 1, "b": 2}, {"b": 4, "a": 3}]
+        body = AsyncTableBody(_AsyncRows(rows))
+        assert_equal(
+            "<tbody><tr><td>1</td><td>2</td></tr>"
+            "<tr><td>3</td><td>4</td></tr></tbody>",
+            _run(body.arender()),
+        )
+
+    def test_mappings_with_columns(self):
+        rows = [{"a": 1, "b": 2, "c": 3}]
+        body = AsyncTableBody(_AsyncRows(rows), columns=["c", "a"])
+        assert_equal(
+            "<tbody><tr><td>3</td><td>1</td></tr></tbody>",
+            _run(body.arender()),
+        )
+
+    def test_batches(self):
+        rows = [(str(i),) for i in range(5)]
+        body = AsyncTableBody(_AsyncRows(rows), batch_size=2)
+        html = _run(body.arender())
+        assert_equal(
+            "<tbody>"
+            + "".join("<tr><td>{}</td></tr>".format(i) for i in range(5))
+            + "</tbody>",
+            html,
+        )
+
+    def test_full_last_batch(self):
+        rows = [(str(i),) for i in range(4)]
+        body = AsyncTableBody(_AsyncRows(rows), batch_size=2)
+        assert_equal(4, _run(body.arender()).count("<tr>"))
+
+    def test_formatters(self):
+        body = AsyncTableBody(
+            _AsyncRows([("<A>", 1)]),
+            formatters=[format_strings, format_decimals],
+        )
+        assert_equal(
+            "<tbody><tr><td>&lt;A&gt;</td><td>1.00</td></tr></tbody>",
+            _run(body.arender()),
+        )
+
+    def test_generator_cells(self):
+        body = AsyncTableBody(_AsyncRows([(Span("x"), "y")]))
+        assert_equal(
+            "<tbody><tr><td><span>x</span></td><td>y</td></tr></tbody>",
+            _run(body.arender()),
+        )
+
+    def test_prefetch(self):
+        rows = [(str(i),) for i in range(6)]
+        source = _AsyncRows(rows)
+        body = AsyncTableBody(source, batch_size=2)
+
+        async def render():
+            fetched = []
+            async for fragment in body.aiter_text():
+                if fragment.startswith("<tr>"):
+                    # Simulate sending the batch to a slow client.
+                    for _ in range(5):
+                        await asyncio.sleep(0)
+                    fetched.append(source.fetched)
+            return fetched
+
+        assert_equal([4, 6, 6], _run(render()))
+
+    def test_early_exit(self):
+        rows = [(str(i),) for i in range(4)]
+        source = _AsyncRows(rows, error=ValueError("db gone"))
+        body = AsyncTableBody(source, batch_size=2)
+        errors = []  # type: List[Dict[str, Any]]
+
+        async def render():
+            asyncio.get_event_loop().set_exception_handler(
+                lambda _, context: errors.append(context)
+            )
+            flattener = AsyncFlattener(body, text=True)
+            assert_equal("<tbody>", await flattener.__anext__())
+            await flattener.__anext__()  # first batch
+            await flattener.aclose()
+            fetched = source.fetched
+            gc.collect()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return fetched
+
+        fetched = _run(render())
+        assert_equal(fetched, source.fetched)
+        assert_true(source.fetched < len(rows))
+        assert_equal([], errors)
+
+    def test_fetch_error(self):
+        body = AsyncTableBody(
+            _AsyncRows([("a",)] * 3, error=ValueError()), batch_size=2
+        )
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_rows_of_different_length(self):
+        body = AsyncTableBody(_AsyncRows([("a", 1), ("b",)]))
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_rows_of_different_length_in_later_batch(self):
+        body = AsyncTableBody(
+            _AsyncRows([("a", 1), ("b", 2), ("c",)]), batch_size=2
+        )
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_rows_do_not_match_columns(self):
+        body = AsyncTableBody(_AsyncRows([("a", 1)]), columns=["x"])
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_too_few_formatters(self):
+        body = AsyncTableBody(_AsyncRows([("a", 1)]), formatters=[None])
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_missing_mapping_value(self):
+        rows = [{"a": 1, "b": 2}, {"a": 3}]
+        body = AsyncTableBody(_AsyncRows(rows))
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_formatter_returns_too_few_values(self):
+        body = AsyncTableBody(
+            _AsyncRows([("a",), ("b",)]), formatters=[lambda v: ["x"]]
+        )
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_too_few_formatters_for_mappings(self):
+        rows = [{"a": 1, "b": 2}]
+        body = AsyncTableBody(_AsyncRows(rows), formatters=[None])
+        with assert_raises(ValueError):
+            _run(body.arender())
+
+    def test_wrong_number_of_formatters_for_columns(self):
+        with assert_raises(ValueError):
+            AsyncTableBody(
+                _AsyncRows([]), columns=["a", "b"], formatters=[None]
+            )
+
+    def test_sync_rendering(self):
+        body = AsyncTableBody(_AsyncRows([]))
+        with assert_raises(TypeError):
+            str(body)
+
+    def test_invalid_batch_size(self):
+        with assert_raises(ValueError):
+            AsyncTableBody(_AsyncRows([]), batch_size=0)
+
+
+class TableFromAsyncRowsTest(TestCase):
+    def test_columns(self):
+        table = Table.from_async_rows(
+            _AsyncRows([{"a": 1, "b": 2}]), columns=["b", "a"]
+        )
+        assert_equal(
+            "<table><thead><tr><th>b</th><th>a</th></tr></thead>"
+            "<tbody><tr><td>2</td><td>1</td></tr></tbody></table>",
+            _run(table.arender()),
+        )
+
+    def test_without_columns(self):
+        table = Table.from_async_rows(_AsyncRows([("x", "y")]))
+        assert_equal(
+            "<table><tbody><tr><td>x</td><td>y</td></tr></tbody></table>",
+            _run(table.arender()),
+        )
+
+    def test_formatters(self):
+        table = Table.from_async_rows(
+            _AsyncRows([("x", 2)]),
+            columns=["Name", "Price"],
+            formatters={"Price": format_decimals},
+        )
+        assert_true("<td>x</td><td>2.00</td>" in _run(table.arender()))
+
+    def test_formatters_for_unknown_columns(self):
+        with assert_raises(ValueError):
+            Table.from_async_rows(
+                _AsyncRows([]),
+                columns=["Name"],
+                formatters={"Price": format_decimals},
+            )
+
+    def test_formatters_without_columns(self):
+        with assert_raises(ValueError):
+            Table.from_async_rows(
+                _AsyncRows([]), formatters={"Price": format_decimals}
+            )
+
+    def test_batch_size(self):
+        rows = [(str(i),) for i in range(3)]
+        table = Table.from_async_rows(_AsyncRows(rows), batch_size=1)
+        assert_equal(3, _run(table.arender()).count("<tr>"))
+
+
 class TableRowTest(TestCase):
     def test_create_cell(self):
         row = TableRow()
@@ -227,6 +837,115 @@ class TableRowTest(TestCase):
         assert_equal(2, len(cells))
 
 
+class RowTemplateTest(TestCase):
+    def _prototype(self):
+        # type: () -> TableRow
+        row = TableRow()
+        row.create_cell(Slot("a")).add_css_classes("first")
+        row.create_cell(Span(Slot("b")))
+        return row
+
+    def test_columns(self):
+        template = RowTemplate(self._prototype())
+        assert_equal(["a", "b"], template.columns)
+
+    def test_explicit_columns(self):
+        template = RowTemplate(self._prototype(), columns=["b", "a"])
+        assert_equal(["b", "a"], template.columns)
+        assert_equal(
+            '<tr><td class="first">x</td><td><span>y</span></td></tr>',
+            template.render_row(("y", "x")),
+        )
+
+    def test_invalid_columns(self):
+        with assert_raises(ValueError):
+            RowTemplate(self._prototype(), columns=["a"])
+        with assert_raises(ValueError):
+            RowTemplate(self._prototype(), columns=["a", "b", "c"])
+        with assert_raises(ValueError):
+            RowTemplate(self._prototype(), columns=["a", "b", "a"])
+
+    def test_render_row(self):
+        template = RowTemplate(self._prototype())
+        assert_equal(
+            '<tr><td class="first">&lt;x&gt;</td>'
+            "<td><span>1.5</span></td></tr>",
+            template.render_row(("<x>", 1.5)),
+        )
+
+    def test_mapping(self):
+        template = RowTemplate(self._prototype())
+        assert_equal(
+            '<tr><td class="first">x</td><td><span>y</span></td></tr>',
+            template.render_row({"b": "y", "a": "x"}),
+        )
+
+    def test_repeated_slot(self):
+        row = TableRow()
+        row.create_cells(Slot("a"), Slot("b"), Slot("a"))
+        template = RowTemplate(row)
+        assert_equal(["a", "b"], template.columns)
+        assert_equal(
+            "<tr><td>x</td><td>y</td><td>x</td></tr>",
+            template.render_row(("x", "y")),
+        )
+
+    def test_braces(self):
+        row = TableRow()
+        row.create_cells("{0}", Slot("a"), "}")
+        template = RowTemplate(row)
+        assert_equal(
+            "<tr><td>{0}</td><td>{x}</td><td>}</td></tr>",
+            template.render_row(("{x}",)),
+        )
+
+    def test_generator_values(self):
+        template = RowTemplate(self._prototype())
+        html = str(template.fill_rows([("x", "y"), (Span("z"), "w")]))
+        assert_equal(
+            '<tr><td class="first">x</td><td><span>y</span></td></tr>'
+            '<tr><td class="first"><span>z</span></td>'
+            "<td><span>w</span></td></tr>",
+            html,
+        )
+
+    def test_wrong_number_of_values(self):
+        template = RowTemplate(self._prototype())
+        with assert_raises(ValueError):
+            template.render_row(("x",))
+
+    def test_prototype_changes(self):
+        prototype = self._prototype()
+        template = RowTemplate(prototype)
+        prototype.id = "changed"
+        assert_equal(
+            '<tr><td class="first">x</td><td><span>y</span></td></tr>',
+            template.render_row(("x", "y")),
+        )
+
+    def test_fill_rows_in_table(self):
+        row = TableRow()
+        row.create_cell(Slot("a"))
+        template = RowTemplate(row)
+        table = Table()
+        table.create_body().append(template.fill_rows([("x",), ("y",)]))
+        assert_equal(
+            "<table><tbody><tr><td>x</td></tr><tr><td>y</td></tr>"
+            "</tbody></table>",
+            str(table),
+        )
+
+    def test_fill_rows_lazily(self):
+        row = TableRow()
+        row.create_cell(Slot("a"))
+        template = RowTemplate(row)
+        rows = ((str(i),) for i in range(ROWS_PER_BATCH * 2 + 1))
+        chunks = iter(template.fill_rows(rows))
+        assert_equal(ROWS_PER_BATCH, next(chunks).count(b"<tr>"))
+        assert_equal((str(ROWS_PER_BATCH),), next(rows))
+        assert_equal(1, len(list(chunks)))
+
+
 class TableCellTest(TestCase):
     def test_default_columns_and_rows(self):
         cell = TableCell("Content")
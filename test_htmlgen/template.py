@@ -0,0 +1,118 @@
+from unittest import TestCase
+
+from asserts import assert_equal, assert_raises
+
+from htmlgen import Division, Document, Span
+from htmlgen.generator import ChildGenerator
+from htmlgen.template import Slot, Template, split_at_slots
+
+
+class SlotTest(TestCase):
+    def test_render_outside_template(self):
+        with assert_raises(ValueError):
+            str(Division(Slot("foo")))
+
+
+class SplitAtSlotsTest(TestCase):
+    def test_no_slots(self):
+        assert_equal(
+            ([b"<div>Foo</div>"], []), split_at_slots(Division("Foo"))
+        )
+
+    def test_slots(self):
+        generator = Division(Slot("foo"), Span(Slot("bar")))
+        assert_equal(
+            ([b"<div>", b"<span>", b"</span></div>"], ["foo", "bar"]),
+            split_at_slots(generator),
+        )
+
+    def test_text(self):
+        generator = Division(u"bär", Slot("foo"))
+        assert_equal(
+            ([u"<div>bär", u"</div>"], ["foo"]),
+            split_at_slots(generator, text=True),
+        )
+
+
+class TemplateTest(TestCase):
+    def test_no_slots(self):
+        template = Template(Division("Foo"))
+        assert_equal(set(), template.slot_names)
+        assert_equal(b"<div>Foo</div>", template.render())
+
+    def test_slots(self):
+        template = Template(
+            Division(Slot("foo"), "-", Span(Slot("bar")), Slot("foo"))
+        )
+        assert_equal({"foo", "bar"}, template.slot_names)
+        assert_equal(
+            b"<div>x &amp; y-<span>b\xc3\xa4r</span>x &amp; y</div>",
+            template.render(foo="x & y", bar="bär"),
+        )
+
+    def test_slot_at_start_and_end(self):
+        generator = ChildGenerator()
+        generator.extend([Slot("foo"), Slot("bar")])
+        template = Template(generator)
+        assert_equal(b"ab", template.render(foo="a", bar="b"))
+
+    def test_generator_value(self):
+        template = Template(Division(Slot("content")))
+        assert_equal(
+            b"<div><span>&lt;Foo&gt;</span></div>",
+            template.render(content=Span("<Foo>")),
+        )
+
+    def test_invalid_value(self):
+        template = Template(Division(Slot("content")))
+        with assert_raises(TypeError):
+            template.render(content=b"Foo")  # type: ignore
+
+    def test_missing_value(self):
+        template = Template(Division(Slot("foo"), Slot("bar")))
+        with assert_raises(TypeError):
+            template.render(foo="Foo")
+
+    def test_unknown_value(self):
+        template = Template(Division(Slot("foo")))
+        with assert_raises(TypeError):
+            template.render(foo="Foo", bar="Bar")
+
+    def test_changes_after_compilation(self):
+        div = Division(Slot("foo"))
+        template = Template(div)
+        div.append("Bar")
+        assert_equal(b"<div>Foo</div>", template.render(foo="Foo"))
+
+    def test_render_text(self):
+        template = Template(Division(Slot("foo")))
+        assert_equal(u"<div>bär</div>", template.render_text(foo=u"bär"))
+
+    def test_fill(self):
+        template = Template(Division(Slot("foo"), Span(Slot("bar"))))
+        generator = template.fill(foo="<Foo>", bar=Span("Bar"))
+        assert_equal(
+            "<div>&lt;Foo&gt;<span><span>Bar</span></span></div>",
+            str(generator),
+        )
+
+    def test_fill_invalid_value(self):
+        template = Template(Division(Slot("content")))
+        with assert_raises(TypeError):
+            template.fill(content=b"<Foo>")  # type: ignore
+
+    def test_fill_missing_value(self):
+        template = Template(Division(Slot("foo")))
+        with assert_raises(TypeError):
+            template.fill()
+
+    def test_document(self):
+        doc = Document(title="My Page")
+        doc.append_body(Slot("body"))
+        template = Template(doc)
+        expected_doc = Document(title="My Page")
+        expected_doc.append_body(Division("Hello"))
+        assert_equal(
+            str(expected_doc),
+            template.render_text(body=Division("Hello")),
+        )